@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import heapq
 import json
 import logging
 import webbrowser
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from operator import attrgetter
 from pathlib import Path
 from typing import Any
 
@@ -432,9 +435,10 @@ def graph(
 
         # Find paths to other entities
         if depth > 1:
+            neighbor_ids = {neighbor_id for neighbor_id, _ in neighbors}
             all_entities = [e.id for e in engine._entities.values()]
             for other_id in all_entities:
-                if other_id != entity and other_id not in [n[0] for n in neighbors]:
+                if other_id != entity and other_id not in neighbor_ids:
                     path = graph_obj.get_path(entity, other_id)
                     if path and len(path) <= depth + 1:
                         click.echo(f"\nPath to {other_id}: {' -> '.join(path)}")
@@ -537,9 +541,7 @@ def relationships(
         return
 
     # Sort by confidence and limit
-    filtered_rels = sorted(filtered_rels, key=lambda r: r.confidence, reverse=True)[
-        :limit
-    ]
+    filtered_rels = heapq.nlargest(limit, filtered_rels, key=attrgetter("confidence"))
 
     # Display relationships
     click.echo(f"\nFound {len(filtered_rels)} relationships:")
@@ -625,24 +627,16 @@ def profile_cmd(
     analyzer = ProfileAnalyzer()
 
     platforms_to_check = [platform] if platform != "all" else ["twitter", "facebook", "linkedin", "instagram"]
-    profiles: dict[str, SocialProfile] = {}
-
-    for plat in platforms_to_check:
-        try:
-            social_profile = _fetch_social_profile(
-                config,
-                plat,
-                username,
-                details,
-                limit if include_posts else 0,
-                include_followers,
-                sentiment,
-                engagement,
-            )
-            if social_profile:
-                profiles[plat] = social_profile
-        except Exception as e:
-            click.echo(f"Error fetching {plat} profile: {e}", err=True)
+    profiles = _fetch_social_profiles(
+        config,
+        platforms_to_check,
+        username,
+        details,
+        limit if include_posts else 0,
+        include_followers,
+        sentiment,
+        engagement,
+    )
 
     if not profiles:
         click.echo(f"No profiles found for username: {username}")
@@ -694,54 +688,93 @@ def profile_cmd(
         click.echo(f"\nExport saved to: {output}")
 
 
-def _fetch_social_profile(
+def _fetch_social_profiles(
     config: dict[str, Any],
-    platform: str,
+    platforms: list[str],
     username: str,
     details: str,
     post_limit: int,
     include_followers: bool,
     analyze_sentiment: bool,
     calculate_engagement: bool,
-) -> SocialProfile | None:
-    """Fetch profile from a specific social media platform."""
+) -> dict[str, SocialProfile]:
+    """Fetch a username from several platforms concurrently.
+
+    Each platform is an independent, network-bound lookup, so they run on a
+    small thread pool instead of one after another. Results keep the order of
+    ``platforms``.
+    """
+    args = (username, details, post_limit, include_followers, analyze_sentiment, calculate_engagement)
+    profiles: dict[str, SocialProfile] = {}
+
+    with ThreadPoolExecutor(max_workers=max(1, len(platforms))) as executor:
+        futures = {plat: executor.submit(_fetch_social_profile, config, plat, *args) for plat in platforms}
+
+    for plat, future in futures.items():
+        try:
+            social_profile = future.result()
+            if social_profile:
+                profiles[plat] = social_profile
+        except Exception as e:
+            click.echo(f"Error fetching {plat} profile: {e}", err=True)
+
+    return profiles
+
+
+def _create_social_source(config: dict[str, Any], platform: str) -> Any | None:
+    """Create the API client for a platform, or None if it is disabled."""
     social_config = config.get("social_media", {}).get(platform, {})
 
     if not social_config.get("enabled", False):
         click.echo(f"{platform.title()} is not enabled in config. Skipping.", err=True)
         return None
 
-    try:
-        if platform == "twitter":
-            from osint.sources.twitter_source import TwitterSource
+    if platform == "twitter":
+        from osint.sources.twitter_source import TwitterSource
 
-            source = TwitterSource(social_config)
-        elif platform == "facebook":
-            from osint.sources.facebook_source import FacebookSource
+        return TwitterSource(social_config)
+    if platform == "facebook":
+        from osint.sources.facebook_source import FacebookSource
 
-            source = FacebookSource(social_config)
-        elif platform == "linkedin":
-            from osint.sources.linkedin_source import LinkedInSource
+        return FacebookSource(social_config)
+    if platform == "linkedin":
+        from osint.sources.linkedin_source import LinkedInSource
 
-            source = LinkedInSource(social_config)
-        elif platform == "instagram":
-            from osint.sources.instagram_source import InstagramSource
+        return LinkedInSource(social_config)
+    if platform == "instagram":
+        from osint.sources.instagram_source import InstagramSource
 
-            source = InstagramSource(social_config)
-        else:
-            return None
+        return InstagramSource(social_config)
+    return None
 
-        if not source.validate_credentials():
-            raise RuntimeError(f"Invalid credentials for {platform}")
 
-        profile = source.get_profile(username)
+def _fetch_social_profile(
+    config: dict[str, Any],
+    platform: str,
+    username: str,
+    details: str,
+    post_limit: int,
+    include_followers: bool,
+    analyze_sentiment: bool,
+    calculate_engagement: bool,
+    source: Any | None = None,
+) -> SocialProfile | None:
+    """Fetch profile from a specific social media platform.
 
-        if post_limit > 0:
-            profile.posts = source.get_posts(profile.user_id, limit=post_limit)
+    Pass ``source`` to reuse an already constructed (and logged-in) client
+    instead of creating a new one.
+    """
+    try:
+        if source is None:
+            source = _create_social_source(config, platform)
+            if source is None:
+                return None
 
-        if calculate_engagement and profile.posts:
-            profile.engagement_metrics = source.get_engagement_metrics(profile, profile.posts)
+        if not source.validate_credentials():
+            raise RuntimeError(f"Invalid credentials for {platform}")
 
+        profile = source.get_profile(username)
+        _load_profile_posts(source, profile, post_limit, calculate_engagement)
         return profile
 
     except Exception as e:
@@ -749,6 +782,49 @@ def _fetch_social_profile(
         return None
 
 
+def _get_profiles_isolated(source: Any, usernames: list[str]) -> list[SocialProfile | None]:
+    """Look up several usernames, with None for any that failed.
+
+    Tries the source's batch lookup first. If the batch raises, falls back to
+    one lookup per username so a single bad account does not sink the rest.
+    """
+    try:
+        found = source.get_profiles(usernames)
+    except Exception as e:
+        click.echo(f"Batch profile lookup failed, fetching one at a time: {e}", err=True)
+    else:
+        for username, profile in zip(usernames, found):
+            if profile is None:
+                click.echo(f"Profile not found: {username}", err=True)
+        return found
+
+    profiles: list[SocialProfile | None] = []
+    for username in usernames:
+        try:
+            profiles.append(source.get_profile(username))
+        except ValueError:
+            click.echo(f"Profile not found: {username}", err=True)
+            profiles.append(None)
+        except Exception as e:
+            click.echo(f"Error fetching profile for {username}: {e}", err=True)
+            profiles.append(None)
+    return profiles
+
+
+def _load_profile_posts(
+    source: Any,
+    profile: SocialProfile,
+    post_limit: int,
+    calculate_engagement: bool,
+) -> None:
+    """Attach recent posts, and optionally engagement metrics, to a profile."""
+    if post_limit > 0:
+        profile.posts = source.get_posts(profile.user_id, limit=post_limit)
+
+    if calculate_engagement and profile.posts:
+        profile.engagement_metrics = source.get_engagement_metrics(profile, profile.posts)
+
+
 def _export_profile_data(
     profiles: dict[str, SocialProfile],
     format_type: str,
@@ -962,31 +1038,24 @@ def followers_cmd(
 ) -> None:
     """Get followers from a social media profile."""
     config = read_config()
-    social_config = config.get("social_media", {}).get(platform, {})
 
     try:
         if platform == "facebook":
             click.echo("Facebook doesn't provide public follower lists for personal profiles.", err=True)
             return
 
-        profile = _fetch_social_profile(config, platform, username, "basic", 0, False, False, False)
+        source = _create_social_source(config, platform)
+        if source is None:
+            return
+
+        profile = _fetch_social_profile(
+            config, platform, username, "basic", 0, False, False, False, source=source
+        )
 
         if not profile:
             click.echo(f"Profile not found for {username} on {platform}")
             return
 
-        if platform == "twitter":
-            from osint.sources.twitter_source import TwitterSource
-            source = TwitterSource(social_config)
-        elif platform == "linkedin":
-            from osint.sources.linkedin_source import LinkedInSource
-            source = LinkedInSource(social_config)
-        elif platform == "instagram":
-            from osint.sources.instagram_source import InstagramSource
-            source = InstagramSource(social_config)
-        else:
-            return
-
         followers = source.get_followers(profile.user_id, limit=limit)
 
         if not followers:
@@ -1071,23 +1140,19 @@ def analyze_cmd(
     platforms_to_check = [platform] if platform != "all" else ["twitter", "facebook", "linkedin", "instagram"]
 
     all_analyses: dict[str, dict[str, Any]] = {}
+    profiles = _fetch_social_profiles(
+        config,
+        platforms_to_check,
+        username,
+        "full",
+        limit,
+        False,
+        True,
+        True,
+    )
 
-    for plat in platforms_to_check:
+    for plat, profile in profiles.items():
         try:
-            profile = _fetch_social_profile(
-                config,
-                plat,
-                username,
-                "full",
-                limit,
-                False,
-                True,
-                True,
-            )
-
-            if not profile:
-                continue
-
             analysis = analyzer.analyze_profile(profile)
             all_analyses[plat] = analysis
 
@@ -1245,22 +1310,23 @@ def compare_cmd(usernames: str, platform: str) -> None:
     if len(username_list) < 2:
         raise click.ClickException("Need at least 2 usernames to compare")
 
+    # One client for every username: parallel logins with the same
+    # credentials trip LinkedIn/Instagram checkpoints. The SDK clients are
+    # not thread-safe, so everything below runs on this thread.
+    source = _create_social_source(config, platform)
+    if source is None:
+        raise click.ClickException("Need at least 2 profiles to compare")
+    if not source.validate_credentials():
+        raise click.ClickException(f"Invalid credentials for {platform}")
+
     profiles: list[SocialProfile] = []
 
-    for username in username_list:
+    for username, profile in zip(username_list, _get_profiles_isolated(source, username_list)):
+        if profile is None:
+            continue
         try:
-            profile = _fetch_social_profile(
-                config,
-                platform,
-                username,
-                "standard",
-                10,
-                False,
-                False,
-                True,
-            )
-            if profile:
-                profiles.append(profile)
+            _load_profile_posts(source, profile, 10, True)
+            profiles.append(profile)
         except Exception as e:
             click.echo(f"Error fetching profile for {username}: {e}", err=True)
 
@@ -5,6 +5,12 @@ from typing import Any
 
 from osint.core.models import Entity, EntityType, Relationship, RelationshipType
 
+_WHITESPACE_RE = re.compile(r"\s+")
+_PUNCTUATION_TABLE = str.maketrans("", "", ".,!?;:\"'()")
+_LOCATION_SUFFIX_RE = re.compile(r"\s+(usa|us|united states|uk|united kingdom)$")
+_NAME_TITLE_RE = re.compile(r"^(mr|ms|mrs|dr|prof)\.?\s+")
+_URL_PREFIX_RE = re.compile(r"^https?://(www\.)?")
+
 
 class MetadataCorrelationAlgorithm:
     """Correlates entities based on metadata (bios, locations, profile images, etc.)."""
@@ -213,33 +219,33 @@ class MetadataCorrelationAlgorithm:
     def _normalize_text(self, text: str) -> str:
         """Normalize text for comparison."""
         # Remove extra whitespace and convert to lowercase
-        text = re.sub(r"\s+", " ", text)
+        text = _WHITESPACE_RE.sub(" ", text)
         text = text.strip().lower()
         # Remove common punctuation
-        text = re.sub(r'[.,!?;:"\'()]', "", text)
+        text = text.translate(_PUNCTUATION_TABLE)
         return text
 
     def _normalize_location(self, location: str) -> str:
         """Normalize location for comparison."""
         location = location.strip().lower()
         # Remove common suffixes
-        location = re.sub(r"\s+(usa|us|united states|uk|united kingdom)$", "", location)
+        location = _LOCATION_SUFFIX_RE.sub("", location)
         return location
 
     def _normalize_name(self, name: str) -> str:
         """Normalize name for comparison."""
         name = name.strip().lower()
         # Remove common titles
-        name = re.sub(r"^(mr|ms|mrs|dr|prof)\.?\s+", "", name)
+        name = _NAME_TITLE_RE.sub("", name)
         # Remove extra whitespace
-        name = re.sub(r"\s+", " ", name)
+        name = _WHITESPACE_RE.sub(" ", name)
         return name
 
     def _normalize_url(self, url: str) -> str:
         """Normalize URL for comparison."""
         url = url.strip().lower()
         # Remove protocol and www
-        url = re.sub(r"^https?://(www\.)?", "", url)
+        url = _URL_PREFIX_RE.sub("", url)
         # Remove trailing slash
         url = url.rstrip("/")
         return url
@@ -3,9 +3,18 @@ from __future__ import annotations
 import ipaddress
 import re
 from typing import Any
+from urllib.parse import urlsplit
 
 from osint.core.models import Entity, EntityType, Relationship, RelationshipType
 
+_SCHEME_RE = re.compile(r"^[a-z][a-z0-9+.-]*://")
+
+# IP version -> (host bits to drop, subnet prefix length, match confidence)
+_SUBNET_RULES: dict[int, tuple[int, int, float]] = {
+    4: (8, 24, 40.0),
+    6: (64, 64, 35.0),
+}
+
 
 class NetworkCorrelationAlgorithm:
     """Correlates entities based on network information (IPs, domains, etc.)."""
@@ -73,52 +82,33 @@ class NetworkCorrelationAlgorithm:
         try:
             ip_obj_a = ipaddress.ip_address(ip_a)
             ip_obj_b = ipaddress.ip_address(ip_b)
-
-            # For IPv4, check /24 subnet
-            if isinstance(ip_obj_a, ipaddress.IPv4Address) and isinstance(
-                ip_obj_b, ipaddress.IPv4Address
-            ):
-                network_a = ipaddress.ip_network(f"{ip_a}/24", strict=False)
-                if ip_obj_b in network_a:
-                    return Relationship(
-                        id=f"rel_{entity_a.id}_{entity_b.id}_subnet",
-                        entity_a=entity_a.id,
-                        entity_b=entity_b.id,
-                        type=RelationshipType.POTENTIAL,
-                        confidence=40.0,
-                        evidence=[f"IPs in same /24 subnet: {network_a}"],
-                        metadata={
-                            "match_type": "ip_subnet",
-                            "subnet": str(network_a),
-                            "ip_a": ip_a,
-                            "ip_b": ip_b,
-                        },
-                    )
-
-            # For IPv6, check /64 subnet
-            if isinstance(ip_obj_a, ipaddress.IPv6Address) and isinstance(
-                ip_obj_b, ipaddress.IPv6Address
-            ):
-                network_a = ipaddress.ip_network(f"{ip_a}/64", strict=False)
-                if ip_obj_b in network_a:
-                    return Relationship(
-                        id=f"rel_{entity_a.id}_{entity_b.id}_subnet",
-                        entity_a=entity_a.id,
-                        entity_b=entity_b.id,
-                        type=RelationshipType.POTENTIAL,
-                        confidence=35.0,
-                        evidence=[f"IPs in same /64 subnet: {network_a}"],
-                        metadata={
-                            "match_type": "ip_subnet",
-                            "subnet": str(network_a),
-                            "ip_a": ip_a,
-                            "ip_b": ip_b,
-                        },
-                    )
         except ValueError:
-            pass
-
-        return None
+            return None
+
+        if ip_obj_a.version != ip_obj_b.version:
+            return None
+
+        # Compare the network bits as integers (/24 for IPv4, /64 for IPv6) and
+        # only build the network object once the prefixes are known to match.
+        host_bits, prefix, confidence = _SUBNET_RULES[ip_obj_a.version]
+        if int(ip_obj_a) >> host_bits != int(ip_obj_b) >> host_bits:
+            return None
+
+        network_a = ipaddress.ip_network(f"{ip_a}/{prefix}", strict=False)
+        return Relationship(
+            id=f"rel_{entity_a.id}_{entity_b.id}_subnet",
+            entity_a=entity_a.id,
+            entity_b=entity_b.id,
+            type=RelationshipType.POTENTIAL,
+            confidence=confidence,
+            evidence=[f"IPs in same /{prefix} subnet: {network_a}"],
+            metadata={
+                "match_type": "ip_subnet",
+                "subnet": str(network_a),
+                "ip_a": ip_a,
+                "ip_b": ip_b,
+            },
+        )
 
     def _correlate_ip_account(
         self, ip_entity: Entity, account_entity: Entity
@@ -158,9 +148,9 @@ class NetworkCorrelationAlgorithm:
             )
 
         # Check for subdomain relationships
-        if domain_a.endswith(f".{domain_b}") or domain_b.endswith(f".{domain_a}"):
-            parent = domain_b if domain_a.endswith(f".{domain_b}") else domain_a
-            child = domain_a if domain_a.endswith(f".{domain_b}") else domain_b
+        a_is_child = domain_a.endswith(f".{domain_b}")
+        if a_is_child or domain_b.endswith(f".{domain_a}"):
+            parent, child = (domain_b, domain_a) if a_is_child else (domain_a, domain_b)
             return Relationship(
                 id=f"rel_{entity_a.id}_{entity_b.id}_subdomain",
                 entity_a=entity_a.id,
@@ -257,12 +247,13 @@ class NetworkCorrelationAlgorithm:
     def _extract_domain_from_url(self, url: str) -> str | None:
         """Extract domain from URL."""
         url = url.strip().lower()
-        # Remove protocol
-        url = re.sub(r"^https?://", "", url)
-        # Remove www
-        url = re.sub(r"^www\.", "", url)
-        # Remove path and query
-        url = url.split("/")[0]
-        # Remove port
-        url = url.split(":")[0]
-        return url if url else None
+        # urlsplit only recognises the host when it follows "//"
+        if not _SCHEME_RE.match(url):
+            url = "//" + url
+        try:
+            host = urlsplit(url).hostname
+        except ValueError:
+            return None
+        if not host:
+            return None
+        return host.removeprefix("www.") or None
@@ -1,10 +1,36 @@
 from __future__ import annotations
 
+import re
+from bisect import bisect_left
 from datetime import datetime, timedelta
 from typing import Any
 
 from osint.core.models import Entity, EntityType, Relationship, RelationshipType
 
+# Zero-padded ISO strings that fromisoformat parses the same way on every
+# supported Python version, and to the same value the strptime formats give.
+_CANONICAL_ISO_RE = re.compile(
+    r"[0-9]{4}-[0-9]{2}-[0-9]{2}(?:[T ][0-9]{2}:[0-9]{2}:[0-9]{2})?"
+    r"|[0-9]{4}-[0-9]{2}-[0-9]{2}T[0-9]{2}:[0-9]{2}:[0-9]{2}(?:\.[0-9]{3}(?:[0-9]{3})?)?Z"
+)
+
+# Fallbacks for everything else, grouped by the shape of string they accept.
+_ISO_Z_FORMATS = (
+    "%Y-%m-%dT%H:%M:%S.%fZ",
+    "%Y-%m-%dT%H:%M:%SZ",
+)
+
+_ISO_FORMATS = (
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%d",
+)
+
+_NON_ISO_FORMATS = (
+    "%d/%m/%Y %H:%M:%S",
+    "%m/%d/%Y %H:%M:%S",
+)
+
 
 class TemporalCorrelationAlgorithm:
     """Correlates entities based on temporal patterns (creation dates, activity, etc.)."""
@@ -97,31 +123,24 @@ class TemporalCorrelationAlgorithm:
         if not activity_times_a or not activity_times_b:
             return None
 
-        # Parse activity times if they're strings
-        activity_times_a = [
-            (self._parse_datetime(t) if isinstance(t, str) else t)
-            for t in activity_times_a
-            if (self._parse_datetime(t) if isinstance(t, str) else t)
-        ]
-        activity_times_b = [
-            (self._parse_datetime(t) if isinstance(t, str) else t)
-            for t in activity_times_b
-            if (self._parse_datetime(t) if isinstance(t, str) else t)
-        ]
+        activity_times_a = self._parse_activity_times(activity_times_a)
+        activity_times_b = self._parse_activity_times(activity_times_b)
 
         if not activity_times_a or not activity_times_b:
             return None
 
-        # Check for overlapping activity times
+        # Count times in A with some time in B within the window. With B
+        # sorted, the nearest candidate at or after time_a - window is found
+        # by bisection instead of scanning all of B for every entry of A.
+        window = timedelta(hours=self.activity_window_hours)
+        sorted_b = sorted(activity_times_b)
+        len_b = len(sorted_b)
         overlap_count = 0
-        window_seconds = self.activity_window_hours * 3600
 
         for time_a in activity_times_a:
-            for time_b in activity_times_b:
-                time_diff = abs((time_a - time_b).total_seconds())
-                if time_diff <= window_seconds:
-                    overlap_count += 1
-                    break
+            idx = bisect_left(sorted_b, time_a - window)
+            if idx < len_b and sorted_b[idx] <= time_a + window:
+                overlap_count += 1
 
         # Calculate overlap ratio
         total_checks = min(len(activity_times_a), len(activity_times_b))
@@ -150,17 +169,35 @@ class TemporalCorrelationAlgorithm:
 
         return None
 
+    def _parse_activity_times(self, times: list[Any]) -> list[datetime]:
+        """Parse activity times that may be strings, dropping unparseable ones."""
+        parse = self._parse_datetime
+        parsed = []
+        for t in times:
+            if isinstance(t, str):
+                t = parse(t)
+            if t:
+                parsed.append(t)
+        return parsed
+
     def _parse_datetime(self, dt_str: str) -> datetime | None:
         """Parse a datetime string in various formats."""
-        formats = [
-            "%Y-%m-%dT%H:%M:%S.%fZ",
-            "%Y-%m-%dT%H:%M:%SZ",
-            "%Y-%m-%dT%H:%M:%S",
-            "%Y-%m-%d %H:%M:%S",
-            "%Y-%m-%d",
-            "%d/%m/%Y %H:%M:%S",
-            "%m/%d/%Y %H:%M:%S",
-        ]
+        # Canonical ISO strings take the fromisoformat fast path; a trailing
+        # "Z" is dropped so the result stays naive, as strptime's was.
+        if _CANONICAL_ISO_RE.fullmatch(dt_str):
+            try:
+                return datetime.fromisoformat(dt_str[:-1] if dt_str.endswith("Z") else dt_str)
+            except ValueError:
+                return None
+
+        # Anything else (e.g. "2020-1-5 10:30:00") goes through strptime,
+        # trying only the formats that could match this string's shape.
+        if dt_str.endswith("Z"):
+            formats = _ISO_Z_FORMATS
+        elif "/" in dt_str:
+            formats = _NON_ISO_FORMATS
+        else:
+            formats = _ISO_FORMATS
 
         for fmt in formats:
             try:
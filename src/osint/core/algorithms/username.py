@@ -11,6 +11,31 @@ except ImportError:
 from osint.core.models import Entity, EntityType, Relationship, RelationshipType
 
 
+def _join_groups(match: re.Match[str]) -> str:
+    return match.group(1) + match.group(2)
+
+
+def _first_group(match: re.Match[str]) -> str:
+    return match.group(1)
+
+
+# Compiled once: (pattern, transform) pairs tried by _pattern_match for every pair.
+_VARIATION_PATTERNS = (
+    # john_doe vs johndoe
+    (re.compile(r"^(.+)_(.+)$"), _join_groups),
+    # johndoe vs john_doe
+    (re.compile(r"^(.+?)[-_](.+)$"), _join_groups),
+    # john.doe vs johndoe
+    (re.compile(r"^(.+)\.(.+)$"), _join_groups),
+    # johndoe99 vs johndoe
+    (re.compile(r"^(.+?)\d+$"), _first_group),
+    # johndoe vs johndoe99
+    (re.compile(r"^(.+)\d+$"), _first_group),
+)
+
+_SEPARATOR_RE = re.compile(r"[-_.]")
+
+
 class UsernameCorrelationAlgorithm:
     """Correlates usernames across platforms using various matching strategies."""
 
@@ -111,22 +136,10 @@ class UsernameCorrelationAlgorithm:
         self, entity_a: Entity, entity_b: Entity, username_a: str, username_b: str
     ) -> Relationship | None:
         """Check if usernames follow common variation patterns."""
-        patterns = [
-            # john_doe vs johndoe
-            (r"^(.+)_(.+)$", lambda m: m.group(1) + m.group(2)),
-            # johndoe vs john_doe
-            (r"^(.+?)[-_](.+)$", lambda m: m.group(1) + m.group(2)),
-            # john.doe vs johndoe
-            (r"^(.+)\.(.+)$", lambda m: m.group(1) + m.group(2)),
-            # johndoe99 vs johndoe
-            (r"^(.+?)\d+$", lambda m: m.group(1)),
-            # johndoe vs johndoe99
-            (r"^(.+)\d+$", lambda m: m.group(1)),
-        ]
-
-        for pattern_str, transform in patterns:
+        for pattern, transform in _VARIATION_PATTERNS:
+            pattern_str = pattern.pattern
             # Try to transform username_a to match username_b
-            match_a = re.match(pattern_str, username_a)
+            match_a = pattern.match(username_a)
             if match_a:
                 transformed = transform(match_a)
                 if transformed == username_b:
@@ -141,7 +154,7 @@ class UsernameCorrelationAlgorithm:
                     )
 
             # Try to transform username_b to match username_a
-            match_b = re.match(pattern_str, username_b)
+            match_b = pattern.match(username_b)
             if match_b:
                 transformed = transform(match_b)
                 if transformed == username_a:
@@ -156,8 +169,8 @@ class UsernameCorrelationAlgorithm:
                     )
 
         # Check for common separators
-        normalized_a = re.sub(r"[-_.]", "", username_a).lower()
-        normalized_b = re.sub(r"[-_.]", "", username_b).lower()
+        normalized_a = _SEPARATOR_RE.sub("", username_a).lower()
+        normalized_b = _SEPARATOR_RE.sub("", username_b).lower()
 
         if normalized_a == normalized_b and username_a != username_b:
             return Relationship(
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import heapq
 import uuid
 from datetime import datetime
+from operator import attrgetter
 from pathlib import Path
 from typing import Any
 
@@ -393,7 +395,7 @@ class CorrelationEngine:
         if clusters:
             lines.append(f"")
             lines.append(f"Top clusters:")
-            for i, cluster in enumerate(sorted(clusters, key=lambda c: c.confidence, reverse=True)[:5]):
+            for i, cluster in enumerate(heapq.nlargest(5, clusters, key=attrgetter("confidence"))):
                 lines.append(f"  {i + 1}. {len(cluster.entities)} entities (confidence: {cluster.confidence:.1f}%)")
 
         return "\n".join(lines)
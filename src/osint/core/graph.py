@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import heapq
 import json
 from collections import defaultdict
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
 from typing import Any
 
@@ -217,8 +219,7 @@ class RelationshipGraph:
     def find_central_entities(self, top_n: int = 10) -> list[tuple[str, float]]:
         """Find most central entities using degree centrality."""
         centrality = nx.degree_centrality(self.graph)
-        sorted_centrality = sorted(centrality.items(), key=lambda x: x[1], reverse=True)
-        return sorted_centrality[:top_n]
+        return heapq.nlargest(top_n, centrality.items(), key=itemgetter(1))
 
     def find_bridges(self) -> list[tuple[str, str]]:
         """Find bridge edges (edges whose removal increases number of components)."""
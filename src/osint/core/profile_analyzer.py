@@ -179,12 +179,22 @@ class ProfileAnalyzer:
             )
 
         hour_counts: Counter[int] = Counter()
-        day_counts: Counter[str] = Counter()
+        weekday_counts: Counter[int] = Counter()
+        weekday_samples: dict[int, datetime] = {}
 
         for post in posts:
-            if post.timestamp:
-                hour_counts[post.timestamp.hour] += 1
-                day_counts[post.timestamp.strftime("%A")] += 1
+            timestamp = post.timestamp
+            if timestamp:
+                hour_counts[timestamp.hour] += 1
+                weekday = timestamp.weekday()
+                weekday_counts[weekday] += 1
+                weekday_samples.setdefault(weekday, timestamp)
+
+        # Count by weekday number and only format the (at most seven) day names
+        # at the end, rather than calling strftime for every post.
+        day_counts: Counter[str] = Counter(
+            {weekday_samples[weekday].strftime("%A"): count for weekday, count in weekday_counts.items()}
+        )
 
         peak_hours = [h for h, _ in hour_counts.most_common(3)]
         peak_days = [d for d, _ in day_counts.most_common(3)]
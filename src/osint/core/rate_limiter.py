@@ -88,6 +88,8 @@ class RateLimiter:
         self._config_path = config_path
         self._configs: dict[str, RateLimitConfig] = dict(self.DEFAULT_CONFIGS)
         self._request_windows: dict[str, deque[RequestEntry]] = defaultdict(deque)
+        # Successful entries currently in each window, kept in step with it.
+        self._window_successes: dict[str, int] = defaultdict(int)
         self._cooldowns: dict[str, datetime] = {}
         self._lock = threading.RLock()
         self._total_requests: dict[str, int] = defaultdict(int)
@@ -115,26 +117,31 @@ class RateLimiter:
 
             self._cleanup_old_entries(platform, now)
 
-            self._check_cooldown(platform, now)
+            wait_time = self._cooldown_remaining(platform, now)
 
             window = self._request_windows[platform]
-            requests_in_window = len([e for e in window if e.success])
+            requests_in_window = self._window_successes[platform]
 
             if requests_in_window >= config.requests_per_window:
-                self._wait_for_window_reset(platform, config, now)
+                wait_time = max(wait_time, self._window_reset_delay(platform, config, now))
             elif config.burst_limit > 0:
-                recent = len(
-                    [
-                        e
-                        for e in window
-                        if (now - e.timestamp).total_seconds() < 60
-                    ]
-                )
+                # Entries are appended in time order, so count back from the
+                # newest and stop at the first one outside the last minute.
+                recent = 0
+                for e in reversed(window):
+                    if (now - e.timestamp).total_seconds() >= 60:
+                        break
+                    recent += 1
                 if recent >= config.burst_limit:
-                    wait_time = 60 - (now - window[-1].timestamp).total_seconds()
-                    if wait_time > 0:
-                        logger.info(f"Burst limit reached for {platform}. Waiting {wait_time:.1f}s")
-                        time.sleep(wait_time)
+                    burst_wait = 60 - (now - window[-1].timestamp).total_seconds()
+                    if burst_wait > 0:
+                        logger.info(f"Burst limit reached for {platform}. Waiting {burst_wait:.1f}s")
+                        wait_time = max(wait_time, burst_wait)
+
+        # Sleep outside the lock so one throttled platform does not stall
+        # acquire/record_request calls for every other platform.
+        if wait_time > 0:
+            time.sleep(wait_time)
 
     def record_request(
         self,
@@ -153,6 +160,8 @@ class RateLimiter:
             )
 
             self._request_windows[platform].append(entry)
+            if success:
+                self._window_successes[platform] += 1
             self._total_requests[platform] += 1
 
             if not success:
@@ -173,7 +182,7 @@ class RateLimiter:
             self._cleanup_old_entries(platform, now)
 
             window = self._request_windows[platform]
-            requests_made = len([e for e in window if e.success])
+            requests_made = self._window_successes[platform]
 
             window_start = now - timedelta(seconds=config.window_seconds)
             window_end = now
@@ -207,6 +216,7 @@ class RateLimiter:
         """Reset rate limit tracking for a platform."""
         with self._lock:
             self._request_windows[platform].clear()
+            self._window_successes[platform] = 0
             if platform in self._cooldowns:
                 del self._cooldowns[platform]
             logger.info(f"Reset rate limiter for platform: {platform}")
@@ -249,18 +259,19 @@ class RateLimiter:
         cutoff = now - timedelta(seconds=config.window_seconds)
 
         while window and window[0].timestamp < cutoff:
-            window.popleft()
+            if window.popleft().success:
+                self._window_successes[platform] -= 1
 
-    def _check_cooldown(self, platform: str, now: datetime) -> None:
-        """Check if platform is in cooldown and wait if necessary."""
+    def _cooldown_remaining(self, platform: str, now: datetime) -> float:
+        """Return the seconds left in the platform's cooldown, if any."""
         if platform in self._cooldowns:
             cooldown_end = self._cooldowns[platform]
             if now < cooldown_end:
                 wait_time = (cooldown_end - now).total_seconds()
                 logger.info(f"Platform {platform} in cooldown. Waiting {wait_time:.1f}s")
-                time.sleep(wait_time)
-            else:
-                del self._cooldowns[platform]
+                return wait_time
+            del self._cooldowns[platform]
+        return 0.0
 
     def _enter_cooldown(self, platform: str) -> None:
         """Enter cooldown mode for a platform."""
@@ -270,17 +281,18 @@ class RateLimiter:
             self._cooldowns[platform] = cooldown_end
             logger.warning(f"Entering cooldown for {platform} until {cooldown_end}")
 
-    def _wait_for_window_reset(self, platform: str, config: RateLimitConfig, now: datetime) -> None:
-        """Wait for the rate limit window to reset."""
+    def _window_reset_delay(self, platform: str, config: RateLimitConfig, now: datetime) -> float:
+        """Return the seconds until the rate limit window resets."""
         window = self._request_windows[platform]
-        if window:
-            reset_time = window[0].timestamp + timedelta(seconds=config.window_seconds)
-            wait_seconds = max(0, (reset_time - now).total_seconds())
-            logger.info(
-                f"Rate limit reached for {platform}. "
-                f"Waiting {wait_seconds:.1f}s for window reset"
-            )
-            time.sleep(wait_seconds)
+        if not window:
+            return 0.0
+        reset_time = window[0].timestamp + timedelta(seconds=config.window_seconds)
+        wait_seconds = max(0.0, (reset_time - now).total_seconds())
+        logger.info(
+            f"Rate limit reached for {platform}. "
+            f"Waiting {wait_seconds:.1f}s for window reset"
+        )
+        return wait_seconds
 
     def _save_config(self) -> None:
         """Save configuration to file."""
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import heapq
 import json
+from operator import attrgetter
 from pathlib import Path
 from typing import Any
 
@@ -52,9 +54,7 @@ class ReportGenerator:
         lines.append("-" * 70)
 
         # Sort by confidence and show top 30
-        top_relationships = sorted(
-            result.relationships, key=lambda r: r.confidence, reverse=True
-        )[:30]
+        top_relationships = heapq.nlargest(30, result.relationships, key=attrgetter("confidence"))
 
         for rel in top_relationships:
             entity_a = self._get_entity_name(rel.entity_a, result.entities)
@@ -322,9 +322,7 @@ class ReportGenerator:
         # Add relationships section
         html += '<h2>Key Relationships</h2>\n'
 
-        top_relationships = sorted(
-            result.relationships, key=lambda r: r.confidence, reverse=True
-        )[:50]
+        top_relationships = heapq.nlargest(50, result.relationships, key=attrgetter("confidence"))
 
         html += '<table>\n'
         html += "<tr><th>Entity A</th><th>Entity B</th><th>Type</th><th>Confidence</th><th>Evidence</th></tr>\n"
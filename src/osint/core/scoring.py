@@ -2,8 +2,24 @@ from __future__ import annotations
 
 from typing import Any
 
+from osint.core.algorithms.temporal import TemporalCorrelationAlgorithm
 from osint.core.models import Entity, Relationship
 
+# Reliability of each entity source; anything unlisted scores 0.7.
+_SOURCE_QUALITY = {
+    "sherlock": 0.8,
+    "api": 0.9,
+    "manual": 0.95,
+    "verified": 1.0,
+}
+_DEFAULT_SOURCE_QUALITY = 0.7
+
+# Attributes whose exact match is a strong identity signal.
+_UNIQUE_ATTRIBUTES = frozenset({"email", "phone", "ip_address", "website"})
+
+# Score by number of evidence entries; four or more score 1.0.
+_EVIDENCE_SCORES = (0.0, 0.3, 0.6, 0.8)
+
 
 class ConfidenceScoring:
     """Calculate confidence scores for correlations."""
@@ -19,6 +35,8 @@ class ConfidenceScoring:
         self.source_quality_weight = source_quality_weight
         self.temporal_consistency_weight = temporal_consistency_weight
         self.uniqueness_weight = uniqueness_weight
+        # Reuse one parser rather than building an algorithm per string date.
+        self._parse_datetime = TemporalCorrelationAlgorithm()._parse_datetime
 
     def calculate_relationship_confidence(
         self,
@@ -85,19 +103,12 @@ class ConfidenceScoring:
         self, entity_a: Entity, entity_b: Entity
     ) -> float:
         """Calculate score based on source reliability."""
-        source_quality_map = {
-            "sherlock": 0.8,
-            "api": 0.9,
-            "manual": 0.95,
-            "verified": 1.0,
-        }
-
         # Get quality scores for each entity's sources
         scores_a = [
-            source_quality_map.get(s.lower(), 0.7) for s in entity_a.sources
+            _SOURCE_QUALITY.get(s.lower(), _DEFAULT_SOURCE_QUALITY) for s in entity_a.sources
         ]
         scores_b = [
-            source_quality_map.get(s.lower(), 0.7) for s in entity_b.sources
+            _SOURCE_QUALITY.get(s.lower(), _DEFAULT_SOURCE_QUALITY) for s in entity_b.sources
         ]
 
         if not scores_a or not scores_b:
@@ -113,8 +124,6 @@ class ConfidenceScoring:
         self, entity_a: Entity, entity_b: Entity
     ) -> float:
         """Calculate score based on temporal consistency."""
-        from datetime import datetime, timedelta
-
         created_a = entity_a.attributes.get("created_date")
         created_b = entity_b.attributes.get("created_date")
 
@@ -123,13 +132,9 @@ class ConfidenceScoring:
 
         # Parse dates if they're strings
         if isinstance(created_a, str):
-            from osint.core.algorithms.temporal import TemporalCorrelationAlgorithm
-
-            created_a = TemporalCorrelationAlgorithm()._parse_datetime(created_a)
+            created_a = self._parse_datetime(created_a)
         if isinstance(created_b, str):
-            from osint.core.algorithms.temporal import TemporalCorrelationAlgorithm
-
-            created_b = TemporalCorrelationAlgorithm()._parse_datetime(created_b)
+            created_b = self._parse_datetime(created_b)
 
         if not created_a or not created_b:
             return 0.0
@@ -154,10 +159,10 @@ class ConfidenceScoring:
     ) -> float:
         """Calculate score based on uniqueness of the match."""
         # Check if the matching attribute is typically unique
-        for key, value in entity_a.attributes.items():
-            if key in {"email", "phone", "ip_address", "website"}:
-                if value and entity_b.attributes.get(key) == value:
-                    return 1.0
+        for key in _UNIQUE_ATTRIBUTES:
+            value = entity_a.attributes.get(key)
+            if value and entity_b.attributes.get(key) == value:
+                return 1.0
 
         # Check username uniqueness
         username_a = entity_a.name.lower()
@@ -176,17 +181,9 @@ class ConfidenceScoring:
     def _calculate_attribute_match_score(self, relationship: Relationship) -> float:
         """Calculate score based on number and quality of attribute matches."""
         evidence_count = len(relationship.evidence)
-
-        if evidence_count == 0:
-            return 0.0
-        elif evidence_count == 1:
-            return 0.3
-        elif evidence_count == 2:
-            return 0.6
-        elif evidence_count == 3:
-            return 0.8
-        else:
-            return 1.0
+        if evidence_count < len(_EVIDENCE_SCORES):
+            return _EVIDENCE_SCORES[evidence_count]
+        return 1.0
 
     def _is_unique_username(self, username: str) -> bool:
         """Check if a username appears to be unique."""
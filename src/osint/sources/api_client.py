@@ -1,7 +1,12 @@
 from __future__ import annotations
 
+import heapq
 import json
 import logging
+import os
+import random
+import tempfile
+import threading
 import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
@@ -9,10 +14,23 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from osint.core.models import EngagementMetrics, Post, SocialPlatform, SocialProfile
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on entries kept in each client's in-process cache layer.
+_MEMORY_CACHE_SIZE = 1024
+
+
+def _dumps(data: Any) -> bytes:
+    """Serialise a cache payload to JSON bytes."""
+    return orjson.dumps(data) if orjson else json.dumps(data).encode("utf-8")
+
 
 @dataclass(slots=True)
 class RateLimitInfo:
@@ -47,6 +65,9 @@ class APIClient(ABC):
         self._cache_enabled = self._config.get("cache_enabled", True)
         self._cache_dir = Path(self._config.get("cache_dir", "~/.osint_cache")).expanduser()
         self._rate_limits: dict[str, RateLimitInfo] = {}
+        self._memory_cache: dict[str, tuple[float, bytes]] = {}
+        self._memory_expiry: list[tuple[float, str]] = []
+        self._memory_lock = threading.Lock()
 
         if self._cache_enabled:
             self._cache_dir.mkdir(parents=True, exist_ok=True)
@@ -56,6 +77,20 @@ class APIClient(ABC):
         """Get user profile by username or ID."""
         raise NotImplementedError
 
+    def get_profiles(self, identifiers: list[str]) -> list[SocialProfile | None]:
+        """Get several profiles at once, with None for users that were not found.
+
+        Platforms with a batch lookup endpoint override this; the default
+        falls back to one get_profile call per identifier.
+        """
+        profiles: list[SocialProfile | None] = []
+        for identifier in identifiers:
+            try:
+                profiles.append(self.get_profile(identifier))
+            except ValueError:
+                profiles.append(None)
+        return profiles
+
     @abstractmethod
     def get_posts(self, user_id: str, limit: int = 100) -> list[Post]:
         """Get posts for a user."""
@@ -81,45 +116,121 @@ class APIClient(ABC):
         """Handle rate limiting and wait if necessary."""
         raise NotImplementedError
 
+    def get_engagement_metrics(self, profile: SocialProfile, posts: list[Post]) -> EngagementMetrics:
+        """Calculate engagement metrics for a profile."""
+        if not posts:
+            return EngagementMetrics(avg_engagement_rate=0.0, total_engagement=0, post_frequency=0.0)
+
+        total_engagement = sum(p.likes + p.shares + p.comments for p in posts)
+
+        follower_count = profile.follower_count or 1
+        engagement_rate = (total_engagement / follower_count) * 100
+
+        return EngagementMetrics(
+            avg_engagement_rate=engagement_rate,
+            total_engagement=total_engagement,
+            post_frequency=len(posts) / 30.0,
+        )
+
     def cache_response(self, key: str, data: Any, ttl_seconds: int = 3600) -> None:
         """Cache a response."""
         if not self._cache_enabled:
             return
 
-        cache_file = self._cache_dir / f"{key}.json"
-        cache_data = {
-            "data": data,
-            "expires_at": (datetime.now().timestamp() + ttl_seconds),
-        }
+        # Serialise once and store the same bytes in both layers, so memory and
+        # disk always agree on what is cacheable.
+        try:
+            payload = _dumps(data)
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Failed to cache response: {e}")
+            return
 
+        expires_at = time.time() + ttl_seconds
+        self._remember(key, expires_at, payload)
+
+        cache_file = self._cache_dir / f"{key}.json"
+        temp_name = None
         try:
-            cache_file.write_text(json.dumps(cache_data), encoding="utf-8")
+            # Write to a sibling temp file and swap it in so concurrent readers
+            # never observe a half-written cache entry.
+            with tempfile.NamedTemporaryFile(
+                "wb", delete=False, dir=str(self._cache_dir), suffix=".tmp"
+            ) as tf:
+                temp_name = tf.name
+                tf.write(b'{"data": ' + payload + b', "expires_at": ' + repr(expires_at).encode() + b"}")
+            os.replace(temp_name, cache_file)
         except Exception as e:
             logger.warning(f"Failed to cache response: {e}")
+            if temp_name:
+                Path(temp_name).unlink(missing_ok=True)
 
     def get_cached_response(self, key: str) -> Any | None:
         """Get cached response if valid."""
         if not self._cache_enabled:
             return None
 
+        now = time.time()
+        payload = None
+        with self._memory_lock:
+            entry = self._memory_cache.get(key)
+            if entry is not None:
+                if now <= entry[0]:
+                    payload = entry[1]
+                else:
+                    del self._memory_cache[key]
+        if payload is not None:
+            # Decode per hit so callers never share mutable objects with the cache.
+            return orjson.loads(payload) if orjson else json.loads(payload)
+
         cache_file = self._cache_dir / f"{key}.json"
 
         if not cache_file.exists():
             return None
 
         try:
-            cache_data = json.loads(cache_file.read_text(encoding="utf-8"))
+            if orjson:
+                cache_data = orjson.loads(cache_file.read_bytes())
+            else:
+                cache_data = json.loads(cache_file.read_text(encoding="utf-8"))
             expires_at = cache_data.get("expires_at", 0)
 
-            if datetime.now().timestamp() > expires_at:
-                cache_file.unlink()
+            if now > expires_at:
+                cache_file.unlink(missing_ok=True)
                 return None
 
-            return cache_data.get("data")
+            data = cache_data.get("data")
+            self._remember(key, expires_at, _dumps(data))
+            return data
         except Exception as e:
             logger.warning(f"Failed to read cache: {e}")
             return None
 
+    def _remember(self, key: str, expires_at: float, payload: bytes) -> None:
+        """Keep a serialised cache entry in memory so repeat lookups skip the disk read."""
+        with self._memory_lock:
+            self._memory_cache.pop(key, None)
+            self._purge_expired(time.time())
+            if len(self._memory_cache) >= _MEMORY_CACHE_SIZE:
+                # Dicts keep insertion order, so the first key is the oldest entry.
+                del self._memory_cache[next(iter(self._memory_cache))]
+            self._memory_cache[key] = (expires_at, payload)
+            heapq.heappush(self._memory_expiry, (expires_at, key))
+            if len(self._memory_expiry) > 2 * len(self._memory_cache):
+                # Rewrites and size evictions leave stale heap records behind;
+                # rebuild so the heap stays bounded by the cache size.
+                self._memory_expiry = [(exp, k) for k, (exp, _) in self._memory_cache.items()]
+                heapq.heapify(self._memory_expiry)
+
+    def _purge_expired(self, now: float) -> None:
+        """Drop expired in-memory entries, soonest expiry first. Caller holds the lock."""
+        expiry = self._memory_expiry
+        while expiry and expiry[0][0] < now:
+            expires_at, key = heapq.heappop(expiry)
+            entry = self._memory_cache.get(key)
+            # Skip heap records left behind by entries that were since rewritten.
+            if entry is not None and entry[0] == expires_at:
+                del self._memory_cache[key]
+
     def _retry_with_backoff(
         self,
         func: callable,
@@ -137,6 +248,9 @@ class APIClient(ABC):
                 if attempt < max_retries - 1:
                     delay = base_delay * (2 ** attempt)
                     delay = min(delay, 32.0)
+                    # Equal jitter: keep at least half the backoff but spread
+                    # retries so parallel callers do not hit the API in lockstep.
+                    delay = delay / 2 + random.uniform(0, delay / 2)
                     logger.debug(f"Retry {attempt + 1}/{max_retries} after {delay:.2f}s")
                     time.sleep(delay)
                 else:
@@ -144,6 +258,18 @@ class APIClient(ABC):
 
         raise last_error
 
+    def _analyze_sentiment(self, text: str) -> float:
+        """Analyze sentiment of post text."""
+        if not text or text.isspace():
+            return 0.0
+        try:
+            from textblob import TextBlob
+
+            blob = TextBlob(text)
+            return blob.sentiment.polarity
+        except Exception:
+            return 0.0
+
     def _update_rate_limit(self, endpoint: str, info: RateLimitInfo) -> None:
         """Update rate limit information for an endpoint."""
         self._rate_limits[endpoint] = info
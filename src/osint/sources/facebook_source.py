@@ -1,16 +1,38 @@
 from __future__ import annotations
 
 import logging
+import re
 from datetime import datetime
+from itertools import islice
 from typing import Any
 
 import facebook
 
-from osint.core.models import EngagementMetrics, Post, SocialPlatform, SocialProfile
+from osint.core.models import Post, SocialPlatform, SocialProfile
 from osint.sources.api_client import APIClient, User
 
 logger = logging.getLogger(__name__)
 
+_HASHTAG_RE = re.compile(r"#(\w+)")
+_MENTION_RE = re.compile(r"\[([^\]]+)\]")
+
+# Largest page the Graph API serves for edge listings; bigger pages mean fewer
+# round-trips when get_all_connections follows the paging cursors.
+_MAX_PAGE_SIZE = 100
+
+
+def _parse_iso(value: str) -> datetime:
+    """Parse an ISO-8601 timestamp, accepting a trailing "Z" on any Python version."""
+    if value[-1] == "Z":
+        value = value[:-1] + "+00:00"
+    return datetime.fromisoformat(value)
+
+
+def _summary_count(post_data: dict[str, Any], edge: str) -> int:
+    """Return ``total_count`` from an edge's ``.summary(true)`` block, or 0."""
+    summary = (post_data.get(edge) or {}).get("summary")
+    return summary.get("total_count", 0) if summary else 0
+
 
 class FacebookSource(APIClient):
     """Facebook Graph API client for OSINT data collection."""
@@ -101,47 +123,31 @@ class FacebookSource(APIClient):
                     user_id,
                     "posts",
                     fields="id,message,created_time,likes.summary(true),comments.summary(true),shares,permalink_url",
-                    limit=min(limit, 25),
+                    limit=min(limit, _MAX_PAGE_SIZE),
                 )
             )
 
             posts = []
-            count = 0
-
-            for post_data in posts_data:
-                if count >= limit:
-                    break
-
-                likes_count = 0
-                comments_count = 0
-                shares_count = 0
-
-                if post_data.get("likes") and post_data["likes"].get("summary"):
-                    likes_count = post_data["likes"]["summary"].get("total_count", 0)
-
-                if post_data.get("comments") and post_data["comments"].get("summary"):
-                    comments_count = post_data["comments"]["summary"].get("total_count", 0)
-
-                if post_data.get("shares"):
-                    shares_count = post_data["shares"].get("count", 0)
-
-                post = Post(
-                    id=str(post_data.get("id", "")),
-                    platform=SocialPlatform.FACEBOOK,
-                    text=post_data.get("message", ""),
-                    timestamp=self._parse_facebook_date(post_data.get("created_time")),
-                    likes=likes_count,
-                    shares=shares_count,
-                    comments=comments_count,
-                    hashtags=self._extract_hashtags(post_data.get("message", "")),
-                    mentions=self._extract_mentions(post_data.get("message", "")),
-                    sentiment=self._analyze_sentiment(post_data.get("message", "")),
-                    metadata={"permalink_url": post_data.get("permalink_url")},
+            for post_data in islice(posts_data, limit):
+                message = post_data.get("message", "")
+                shares = post_data.get("shares")
+
+                posts.append(
+                    Post(
+                        id=str(post_data.get("id", "")),
+                        platform=SocialPlatform.FACEBOOK,
+                        text=message,
+                        timestamp=self._parse_facebook_date(post_data.get("created_time")),
+                        likes=_summary_count(post_data, "likes"),
+                        shares=shares.get("count", 0) if shares else 0,
+                        comments=_summary_count(post_data, "comments"),
+                        hashtags=self._extract_hashtags(message),
+                        mentions=self._extract_mentions(message),
+                        sentiment=self._analyze_sentiment(message),
+                        metadata={"permalink_url": post_data.get("permalink_url")},
+                    )
                 )
 
-                posts.append(post)
-                count += 1
-
             self.cache_response(cache_key, [p.to_dict() for p in posts], ttl_seconds=604800)
             return posts
 
@@ -264,50 +270,22 @@ class FacebookSource(APIClient):
             return None
 
         try:
-            return datetime.strptime(date_str, "%Y-%m-%dT%H:%M:%S%z")
+            return _parse_iso(date_str)
         except ValueError:
+            # Python < 3.11 fromisoformat rejects Graph API's "+0000" offsets.
             try:
-                return datetime.fromisoformat(date_str.replace("Z", "+00:00"))
-            except Exception:
+                return datetime.strptime(date_str, "%Y-%m-%dT%H:%M:%S%z")
+            except ValueError:
                 return None
 
     def _extract_hashtags(self, text: str) -> list[str]:
         """Extract hashtags from text."""
-        import re
-
-        return re.findall(r"#(\w+)", text)
+        if "#" not in text:
+            return []
+        return _HASHTAG_RE.findall(text)
 
     def _extract_mentions(self, text: str) -> list[str]:
         """Extract mentions from text."""
-        import re
-
-        return re.findall(r"\[([^\]]+)\]", text)
-
-    def _analyze_sentiment(self, text: str) -> float:
-        """Analyze sentiment of post text."""
-        try:
-            from textblob import TextBlob
-
-            blob = TextBlob(text)
-            return blob.sentiment.polarity
-        except Exception:
-            return 0.0
-
-    def get_engagement_metrics(self, profile: SocialProfile, posts: list[Post]) -> EngagementMetrics:
-        """Calculate engagement metrics for a profile."""
-        if not posts:
-            return EngagementMetrics(avg_engagement_rate=0.0, total_engagement=0, post_frequency=0.0)
-
-        total_engagement = sum(p.likes + p.shares + p.comments for p in posts)
-        avg_engagement_rate = total_engagement / len(posts) if posts else 0.0
-
-        follower_count = profile.follower_count or 1
-        engagement_rate = (total_engagement / follower_count) * 100
-
-        post_frequency = len(posts) / 30.0 if posts else 0.0
-
-        return EngagementMetrics(
-            avg_engagement_rate=engagement_rate,
-            total_engagement=total_engagement,
-            post_frequency=post_frequency,
-        )
+        if "[" not in text:
+            return []
+        return _MENTION_RE.findall(text)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+import re
 from datetime import datetime
 from typing import Any
 
@@ -8,11 +9,14 @@ from instagrapi import Client
 from instagrapi.exceptions import (ChallengeRequired, LoginRequired,
                                     PrivateError, UserNotFound)
 
-from osint.core.models import EngagementMetrics, Post, SocialPlatform, SocialProfile
+from osint.core.models import Post, SocialPlatform, SocialProfile
 from osint.sources.api_client import APIClient, User
 
 logger = logging.getLogger(__name__)
 
+_HASHTAG_RE = re.compile(r"#(\w+)")
+_MENTION_RE = re.compile(r"@(\w+)")
+
 
 class InstagramSource(APIClient):
     """Instagram API client for OSINT data collection."""
@@ -135,29 +139,18 @@ class InstagramSource(APIClient):
             if not user_medias:
                 return []
 
-            posts = []
-            for media in user_medias[:limit]:
-                post = Post(
-                    id=str(media.pk),
-                    platform=SocialPlatform.INSTAGRAM,
-                    text=media.caption_text or "",
-                    timestamp=media.taken_at,
-                    likes=media.like_count or 0,
-                    shares=0,
-                    comments=media.comment_count or 0,
-                    hashtags=self._extract_hashtags(media.caption_text or ""),
-                    mentions=self._extract_mentions(media.caption_text or ""),
-                    media_urls=self._extract_media_urls(media),
-                    sentiment=self._analyze_sentiment(media.caption_text or ""),
-                    metadata={
+            posts = [
+                self._build_post(
+                    media,
+                    {
                         "media_type": media.media_type,
                         "play_count": media.play_count,
                         "view_count": media.view_count,
                         "location": media.location.name if media.location else None,
                     },
                 )
-
-                posts.append(post)
+                for media in user_medias[:limit]
+            ]
 
             self.cache_response(cache_key, [p.to_dict() for p in posts], ttl_seconds=604800)
             return posts
@@ -296,34 +289,33 @@ class InstagramSource(APIClient):
             if not posts_data:
                 return []
 
-            posts = []
-            for media in posts_data[:limit]:
-                post = Post(
-                    id=str(media.pk),
-                    platform=SocialPlatform.INSTAGRAM,
-                    text=media.caption_text or "",
-                    timestamp=media.taken_at,
-                    likes=media.like_count or 0,
-                    shares=0,
-                    comments=media.comment_count or 0,
-                    hashtags=self._extract_hashtags(media.caption_text or ""),
-                    mentions=self._extract_mentions(media.caption_text or ""),
-                    media_urls=self._extract_media_urls(media),
-                    sentiment=self._analyze_sentiment(media.caption_text or ""),
-                    metadata={
-                        "hashtag": hashtag,
-                        "media_type": media.media_type,
-                    },
-                )
-
-                posts.append(post)
-
-            return posts
+            return [
+                self._build_post(media, {"hashtag": hashtag, "media_type": media.media_type})
+                for media in posts_data[:limit]
+            ]
 
         except Exception as e:
             logger.error(f"Error searching Instagram hashtag: {e}")
             raise
 
+    def _build_post(self, media: Any, metadata: dict[str, Any]) -> Post:
+        """Build a Post from an instagrapi media object."""
+        caption = media.caption_text or ""
+        return Post(
+            id=str(media.pk),
+            platform=SocialPlatform.INSTAGRAM,
+            text=caption,
+            timestamp=media.taken_at,
+            likes=media.like_count or 0,
+            shares=0,
+            comments=media.comment_count or 0,
+            hashtags=self._extract_hashtags(caption),
+            mentions=self._extract_mentions(caption),
+            media_urls=self._extract_media_urls(media),
+            sentiment=self._analyze_sentiment(caption),
+            metadata=metadata,
+        )
+
     def _extract_media_urls(self, media: Any) -> list[str]:
         """Extract media URLs from Instagram media object."""
         urls = []
@@ -341,41 +333,12 @@ class InstagramSource(APIClient):
 
     def _extract_hashtags(self, text: str) -> list[str]:
         """Extract hashtags from text."""
-        import re
-
-        return re.findall(r"#(\w+)", text)
+        if "#" not in text:
+            return []
+        return _HASHTAG_RE.findall(text)
 
     def _extract_mentions(self, text: str) -> list[str]:
         """Extract mentions from text."""
-        import re
-
-        return re.findall(r"@(\w+)", text)
-
-    def _analyze_sentiment(self, text: str) -> float:
-        """Analyze sentiment of post text."""
-        try:
-            from textblob import TextBlob
-
-            blob = TextBlob(text)
-            return blob.sentiment.polarity
-        except Exception:
-            return 0.0
-
-    def get_engagement_metrics(self, profile: SocialProfile, posts: list[Post]) -> EngagementMetrics:
-        """Calculate engagement metrics for a profile."""
-        if not posts:
-            return EngagementMetrics(avg_engagement_rate=0.0, total_engagement=0, post_frequency=0.0)
-
-        total_engagement = sum(p.likes + p.shares + p.comments for p in posts)
-        avg_engagement_rate = total_engagement / len(posts) if posts else 0.0
-
-        follower_count = profile.follower_count or 1
-        engagement_rate = (total_engagement / follower_count) * 100
-
-        post_frequency = len(posts) / 30.0 if posts else 0.0
-
-        return EngagementMetrics(
-            avg_engagement_rate=engagement_rate,
-            total_engagement=total_engagement,
-            post_frequency=post_frequency,
-        )
+        if "@" not in text:
+            return []
+        return _MENTION_RE.findall(text)
@@ -1,17 +1,39 @@
 from __future__ import annotations
 
 import logging
+import re
+import time
 from datetime import datetime
 from typing import Any
 
 from linkedin_api import Linkedin
 from requests.exceptions import RequestException
 
-from osint.core.models import EngagementMetrics, Post, SocialPlatform, SocialProfile
+from osint.core.models import Post, SocialPlatform, SocialProfile
 from osint.sources.api_client import APIClient, User
 
 logger = logging.getLogger(__name__)
 
+_HASHTAG_RE = re.compile(r"#(\w+)")
+_MENTION_RE = re.compile(r"@(\w+)")
+
+# How long a raw profile response is reused by get_profile/experience/skills.
+_PROFILE_DATA_TTL = 60.0
+
+
+def _picture_url(profile_data: dict[str, Any]) -> str | None:
+    """Return the first display image URL from a profile's picture block."""
+    picture = profile_data.get("picture")
+    if not picture:
+        return None
+    elements = (picture.get("displayImage~") or {}).get("elements")
+    if not elements:
+        return None
+    identifiers = elements[0].get("identifiers")
+    if not identifiers:
+        return None
+    return identifiers[0].get("identifier")
+
 
 class LinkedInSource(APIClient):
     """LinkedIn API client for OSINT data collection."""
@@ -25,6 +47,7 @@ class LinkedInSource(APIClient):
         self._api_key = self._config.get("api_key", "")
         self._rate_limit_default = self._config.get("rate_limit", 100)
         self._client: Linkedin | None = None
+        self._profile_data: dict[str, tuple[float, dict[str, Any]]] = {}
 
         if self._username and self._password:
             try:
@@ -59,7 +82,7 @@ class LinkedInSource(APIClient):
             raise RuntimeError("LinkedIn client not initialized. Check credentials in config.")
 
         try:
-            profile_data = self._retry_with_backoff(lambda: self._client.get_profile(identifier))
+            profile_data = self._fetch_profile_data(identifier)
 
             if not profile_data:
                 raise ValueError(f"Profile '{identifier}' not found on LinkedIn")
@@ -71,7 +94,7 @@ class LinkedInSource(APIClient):
                 display_name=f"{profile_data.get('firstName', '')} {profile_data.get('lastName', '')}".strip(),
                 bio=profile_data.get("summary", ""),
                 profile_url=f"https://linkedin.com/in/{identifier}",
-                profile_picture_url=profile_data.get("picture", {}).get("displayImage~", {}).get("elements", [{}])[0].get("identifiers", [{}])[0].get("identifier") if profile_data.get("picture") else None,
+                profile_picture_url=_picture_url(profile_data),
                 follower_count=profile_data.get("follower_count", 0),
                 verified=profile_data.get("verified", False),
                 metadata={
@@ -115,17 +138,18 @@ class LinkedInSource(APIClient):
 
             posts = []
             for post_data in posts_data[:limit]:
+                text = post_data.get("text", "")
                 post = Post(
                     id=str(post_data.get("activityUrn", post_data.get("id", ""))),
                     platform=SocialPlatform.LINKEDIN,
-                    text=post_data.get("text", ""),
+                    text=text,
                     timestamp=self._parse_linkedin_date(post_data.get("createdTime")),
                     likes=post_data.get("likes", {}).get("total", 0),
                     shares=post_data.get("shares", {}).get("total", 0),
                     comments=post_data.get("comments", {}).get("total", 0),
-                    hashtags=self._extract_hashtags(post_data.get("text", "")),
-                    mentions=self._extract_mentions(post_data.get("text", "")),
-                    sentiment=self._analyze_sentiment(post_data.get("text", "")),
+                    hashtags=self._extract_hashtags(text),
+                    mentions=self._extract_mentions(text),
+                    sentiment=self._analyze_sentiment(text),
                     metadata={
                         "author_urn": post_data.get("author"),
                         "activity_urn": post_data.get("activityUrn"),
@@ -228,75 +252,54 @@ class LinkedInSource(APIClient):
 
     def get_profile_experience(self, user_id: str) -> list[dict[str, Any]]:
         """Get work experience for a LinkedIn profile."""
-        if not self._client:
-            raise RuntimeError("LinkedIn client not initialized")
-
-        try:
-            profile = self._retry_with_backoff(lambda: self._client.get_profile(user_id))
-            return profile.get("experience", [])
-        except Exception as e:
-            logger.error(f"Error fetching LinkedIn experience: {e}")
-            raise
+        return self._get_profile_section(user_id, "experience")
 
     def get_profile_skills(self, user_id: str) -> list[dict[str, Any]]:
         """Get skills for a LinkedIn profile."""
+        return self._get_profile_section(user_id, "skills")
+
+    def _get_profile_section(self, user_id: str, section: str) -> list[dict[str, Any]]:
+        """Return one list section of a profile, or an empty list if absent."""
         if not self._client:
             raise RuntimeError("LinkedIn client not initialized")
 
         try:
-            profile = self._retry_with_backoff(lambda: self._client.get_profile(user_id))
-            return profile.get("skills", [])
+            profile = self._fetch_profile_data(user_id)
+            return (profile.get(section) or []) if profile else []
         except Exception as e:
-            logger.error(f"Error fetching LinkedIn skills: {e}")
+            logger.error(f"Error fetching LinkedIn {section}: {e}")
             raise
 
+    def _fetch_profile_data(self, identifier: str) -> dict[str, Any]:
+        """Fetch raw profile data, reusing a response fetched in the last minute."""
+        now = time.monotonic()
+        entry = self._profile_data.get(identifier)
+        if entry and now - entry[0] < _PROFILE_DATA_TTL:
+            return entry[1]
+
+        profile_data = self._retry_with_backoff(lambda: self._client.get_profile(identifier))
+        if profile_data:
+            self._profile_data[identifier] = (now, profile_data)
+        return profile_data
+
     def _parse_linkedin_date(self, date_str: str | None) -> datetime | None:
         """Parse LinkedIn date string to datetime."""
-        if not date_str:
+        if not date_str or not isinstance(date_str, str):
             return None
 
         try:
             return datetime.fromisoformat(date_str.replace("Z", "+00:00"))
-        except Exception:
+        except ValueError:
             return None
 
     def _extract_hashtags(self, text: str) -> list[str]:
         """Extract hashtags from text."""
-        import re
-
-        return re.findall(r"#(\w+)", text)
+        if "#" not in text:
+            return []
+        return _HASHTAG_RE.findall(text)
 
     def _extract_mentions(self, text: str) -> list[str]:
         """Extract mentions from text."""
-        import re
-
-        return re.findall(r"@(\w+)", text)
-
-    def _analyze_sentiment(self, text: str) -> float:
-        """Analyze sentiment of post text."""
-        try:
-            from textblob import TextBlob
-
-            blob = TextBlob(text)
-            return blob.sentiment.polarity
-        except Exception:
-            return 0.0
-
-    def get_engagement_metrics(self, profile: SocialProfile, posts: list[Post]) -> EngagementMetrics:
-        """Calculate engagement metrics for a profile."""
-        if not posts:
-            return EngagementMetrics(avg_engagement_rate=0.0, total_engagement=0, post_frequency=0.0)
-
-        total_engagement = sum(p.likes + p.shares + p.comments for p in posts)
-        avg_engagement_rate = total_engagement / len(posts) if posts else 0.0
-
-        follower_count = profile.follower_count or 1
-        engagement_rate = (total_engagement / follower_count) * 100
-
-        post_frequency = len(posts) / 30.0 if posts else 0.0
-
-        return EngagementMetrics(
-            avg_engagement_rate=engagement_rate,
-            total_engagement=total_engagement,
-            post_frequency=post_frequency,
-        )
+        if "@" not in text:
+            return []
+        return _MENTION_RE.findall(text)
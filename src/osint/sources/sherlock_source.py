@@ -1,13 +1,22 @@
 from __future__ import annotations
 
+import heapq
+import itertools
 import json
 import random
 import re
+import threading
 import time
 from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass
+from types import MappingProxyType
 from typing import Any, Callable, Mapping, Sequence
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from osint.core.datasource import DataSource, ProgressCallback
 from osint.core.models import QueryResult, QueryStatus
 
@@ -23,6 +32,13 @@ def _slug(value: str) -> str:
 
 
 def _format_template(template: str, username: str) -> str:
+    # Sherlock URLs use a bare "{}" placeholder. When that is the only brace
+    # usage, a plain replace gives the same result as str.format without
+    # first raising and catching an error for the keyword attempt.
+    placeholders = template.count("{}")
+    if placeholders and template.count("{") == placeholders == template.count("}"):
+        return template.replace("{}", username)
+
     try:
         return template.format(username=username)
     except Exception:
@@ -32,6 +48,27 @@ def _format_template(template: str, username: str) -> str:
             return template.replace("{}", username)
 
 
+_MAX_RETRY_AFTER = 30.0
+
+# Throttling or upstream failures worth retrying rather than reporting.
+_RETRIABLE_STATUSES = frozenset({429, 500, 502, 503, 520, 521, 522})
+# Statuses treated as a hit when the site has no errorType to check.
+_FOUND_STATUSES = frozenset({200, 301, 302, 303, 307, 308})
+
+
+def _parse_retry_after(headers: Mapping[str, Any] | None) -> float | None:
+    if not headers:
+        return None
+    value = headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        # HTTP-date form; fall back to exponential backoff.
+        return None
+
+
 def _load_sherlock_site_data() -> dict[str, Any]:
     try:
         import importlib.resources
@@ -56,8 +93,11 @@ def _load_sherlock_site_data() -> dict[str, Any]:
 
         for pkg, resource in candidates:
             try:
-                payload = importlib.resources.files(pkg).joinpath(resource).read_text(encoding="utf-8")
-                data = json.loads(payload)
+                resource_path = importlib.resources.files(pkg).joinpath(resource)
+                if orjson:
+                    data = orjson.loads(resource_path.read_bytes())
+                else:
+                    data = json.loads(resource_path.read_text(encoding="utf-8"))
                 if isinstance(data, dict) and data:
                     # Filter out non-dict entries like $schema
                     return {k: v for k, v in data.items() if isinstance(v, dict)}
@@ -74,6 +114,20 @@ def _load_sherlock_site_data() -> dict[str, Any]:
         ) from e
 
 
+_SITE_DATA_CACHE: dict[str, Any] | None = None
+_SITE_DATA_LOCK = threading.Lock()
+
+
+def _shared_site_data() -> dict[str, Any]:
+    """Load the Sherlock sites database once per process and share it between sources."""
+    global _SITE_DATA_CACHE
+
+    with _SITE_DATA_LOCK:
+        if _SITE_DATA_CACHE is None:
+            _SITE_DATA_CACHE = _load_sherlock_site_data()
+        return _SITE_DATA_CACHE
+
+
 @dataclass(slots=True)
 class _TaskContext:
     username: str
@@ -87,10 +141,18 @@ class _TaskContext:
 class _ThreadPoolSession:
     def __init__(self, max_workers: int) -> None:
         import requests
+        from requests.adapters import DEFAULT_POOLSIZE, HTTPAdapter
 
         self._executor = ThreadPoolExecutor(max_workers=max_workers)
         self._session = requests.Session()
 
+        # Match FuturesSession: give every worker a keep-alive connection
+        # instead of letting urllib3 discard sockets beyond its default pool.
+        if max_workers > DEFAULT_POOLSIZE:
+            adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers)
+            self._session.mount("https://", adapter)
+            self._session.mount("http://", adapter)
+
     def request(self, method: str, url: str, **kwargs: Any) -> Future[Any]:
         return self._executor.submit(self._session.request, method, url, **kwargs)
 
@@ -122,10 +184,12 @@ class SherlockSource(DataSource):
         self._session_factory = session_factory
         self._sleeper = sleeper or time.sleep
 
-    def _ensure_site_data(self) -> dict[str, Any]:
+    def _ensure_site_data(self) -> Mapping[str, Any]:
+        # The table is shared by every instance in the process; hand out a
+        # read-only proxy instead of copying several hundred entries per call.
         if self._site_data is None:
-            self._site_data = _load_sherlock_site_data()
-        return dict(self._site_data)
+            self._site_data = _shared_site_data()
+        return MappingProxyType(self._site_data)
 
     def available_sites(self) -> list[str]:
         return sorted(self._ensure_site_data().keys())
@@ -197,7 +261,8 @@ class SherlockSource(DataSource):
         no_nsfw: bool | None = None,
         progress_callback: ProgressCallback | None = None,
     ) -> list[QueryResult]:
-        normalized_usernames = [u.strip() for u in usernames if str(u).strip()]
+        # Drop repeats up front; each extra copy would cost one request per site.
+        normalized_usernames = list(dict.fromkeys(u.strip() for u in usernames if str(u).strip()))
         if not normalized_usernames:
             return []
 
@@ -220,6 +285,17 @@ class SherlockSource(DataSource):
         results: list[QueryResult] = []
         completed = 0
 
+        site_headers: dict[str, dict[str, str]] = {}
+
+        # Retries waiting out their backoff: (not_before, seq, site, username, attempt).
+        # The dispatcher keeps draining other sites while these wait.
+        pending: list[tuple[float, int, str, str, int]] = []
+        retry_seq = itertools.count()
+
+        def schedule_retry(ctx: _TaskContext, retry_after: float | None = None) -> None:
+            not_before = time.monotonic() + self._backoff(ctx.attempt, retry_after)
+            heapq.heappush(pending, (not_before, next(retry_seq), ctx.site_name, ctx.username, ctx.attempt + 1))
+
         def submit(site_name: str, username: str, attempt: int) -> None:
             site = data[site_name]
             if not isinstance(site, dict):
@@ -237,7 +313,12 @@ class SherlockSource(DataSource):
                 "allow_redirects": allow_redirects,
             }
             if isinstance(headers, dict):
-                kwargs["headers"] = {str(k): str(v) for k, v in headers.items()}
+                # Stringify each site's headers once and share the dict across
+                # every username and retry for that site.
+                prepared = site_headers.get(site_name)
+                if prepared is None:
+                    prepared = site_headers[site_name] = {str(k): str(v) for k, v in headers.items()}
+                kwargs["headers"] = prepared
 
             post_body = site.get("post_body")
             if method != "GET" and post_body is not None:
@@ -261,8 +342,21 @@ class SherlockSource(DataSource):
                 submit(site_name, username, attempt=1)
 
         try:
-            while in_flight:
-                done, _ = wait(in_flight.keys(), return_when=FIRST_COMPLETED)
+            while in_flight or pending:
+                now = time.monotonic()
+                while pending and pending[0][0] <= now:
+                    _, _, site_name, username, attempt = heapq.heappop(pending)
+                    submit(site_name, username, attempt=attempt)
+
+                if not in_flight:
+                    # Nothing else to drain: wait out the earliest retry, then send it.
+                    not_before, _, site_name, username, attempt = heapq.heappop(pending)
+                    self._sleeper(max(0.0, not_before - now))
+                    submit(site_name, username, attempt=attempt)
+                    continue
+
+                wait_timeout = max(0.0, pending[0][0] - now) if pending else None
+                done, _ = wait(in_flight.keys(), timeout=wait_timeout, return_when=FIRST_COMPLETED)
 
                 for future in done:
                     ctx = in_flight.pop(future)
@@ -273,8 +367,7 @@ class SherlockSource(DataSource):
                         resp = future.result()
                     except Exception as e:
                         if ctx.attempt <= retries:
-                            self._backoff(ctx.attempt)
-                            submit(ctx.site_name, ctx.username, attempt=ctx.attempt + 1)
+                            schedule_retry(ctx)
                             continue
 
                         results.append(
@@ -295,8 +388,7 @@ class SherlockSource(DataSource):
                     status, meta = self._interpret_response(ctx, resp)
 
                     if status == QueryStatus.ERROR and meta.get("retriable") and ctx.attempt <= retries:
-                        self._backoff(ctx.attempt)
-                        submit(ctx.site_name, ctx.username, attempt=ctx.attempt + 1)
+                        schedule_retry(ctx, meta.get("retry_after"))
                         continue
 
                     results.append(
@@ -331,12 +423,14 @@ class SherlockSource(DataSource):
         except Exception:
             return _ThreadPoolSession(max_workers=threads)
 
-    def _backoff(self, attempt: int) -> None:
+    def _backoff(self, attempt: int, retry_after: float | None = None) -> float:
         base = 0.35
         delay = base * (2 ** max(0, attempt - 1))
         delay = min(delay, 8.0)
-        delay = delay + random.random() * 0.2
-        self._sleeper(delay)
+        if retry_after is not None:
+            # Honour the server's hint instead of retrying into the same limit.
+            delay = max(delay, min(retry_after, _MAX_RETRY_AFTER))
+        return delay + random.random() * 0.2
 
     def _extract_response_time(self, resp: Any, fallback: float) -> float:
         elapsed = getattr(resp, "elapsed", None)
@@ -376,12 +470,15 @@ class SherlockSource(DataSource):
         if isinstance(tags, list):
             meta["tags"] = [str(t) for t in tags]
 
-        if status_code in {429, 500, 502, 503, 520, 521, 522}:
+        if status_code in _RETRIABLE_STATUSES:
             meta["retriable"] = True
             meta["error"] = "rate_limited" if status_code == 429 else "upstream_error"
+            retry_after = _parse_retry_after(getattr(resp, "headers", None))
+            if retry_after is not None:
+                meta["retry_after"] = retry_after
             return (QueryStatus.ERROR, meta)
 
-        if status_code == 403 and "cloudflare" in str(getattr(resp, "headers", {}) or {}).get("Server", "").lower():
+        if status_code == 403 and "cloudflare" in str((getattr(resp, "headers", None) or {}).get("Server", "")).lower():
             meta["error"] = "waf_detected"
             return (QueryStatus.ERROR, meta)
 
@@ -430,7 +527,7 @@ class SherlockSource(DataSource):
             meta["error"] = "http_error"
             return (QueryStatus.ERROR, meta)
 
-        if status_code in {200, 301, 302, 303, 307, 308}:
+        if status_code in _FOUND_STATUSES:
             return (QueryStatus.FOUND, meta)
 
         meta["error"] = "unexpected_http_status"
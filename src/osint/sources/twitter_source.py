@@ -7,11 +7,27 @@ from typing import Any
 
 import tweepy
 
-from osint.core.models import EngagementMetrics, Post, SocialPlatform, SocialProfile
+from osint.core.models import Post, SocialPlatform, SocialProfile
 from osint.sources.api_client import APIClient, RateLimitInfo, User
 
 logger = logging.getLogger(__name__)
 
+_USER_FIELDS = [
+    "id",
+    "name",
+    "username",
+    "description",
+    "profile_image_url",
+    "public_metrics",
+    "verified",
+    "created_at",
+    "location",
+    "url",
+]
+
+# Maximum usernames accepted by one users-lookup request.
+_USERS_LOOKUP_BATCH = 100
+
 
 class TwitterSource(APIClient):
     """Twitter/X API v2 client for OSINT data collection."""
@@ -48,7 +64,8 @@ class TwitterSource(APIClient):
 
     def get_profile(self, identifier: str) -> SocialProfile:
         """Get Twitter user profile by username."""
-        cache_key = self._get_cache_key("profile", identifier)
+        # Usernames are case-insensitive, so cache under the lower-cased name.
+        cache_key = self._get_cache_key("profile", identifier.lower())
         cached = self.get_cached_response(cache_key)
         if cached:
             return SocialProfile(**cached)
@@ -58,50 +75,13 @@ class TwitterSource(APIClient):
 
         try:
             user = self._retry_with_backoff(
-                lambda: self._client.get_user(
-                    username=identifier,
-                    user_fields=[
-                        "id",
-                        "name",
-                        "username",
-                        "description",
-                        "profile_image_url",
-                        "public_metrics",
-                        "verified",
-                        "created_at",
-                        "location",
-                        "url",
-                    ],
-                )
+                lambda: self._client.get_user(username=identifier, user_fields=_USER_FIELDS)
             )
 
             if not user.data:
                 raise ValueError(f"User '{identifier}' not found")
 
-            data = user.data
-
-            profile = SocialProfile(
-                platform=SocialPlatform.TWITTER,
-                user_id=str(data.id),
-                username=data.username,
-                display_name=data.name,
-                bio=data.description or "",
-                profile_url=f"https://twitter.com/{data.username}",
-                profile_picture_url=data.profile_image_url,
-                verified=data.verified or False,
-                created_date=data.created_at,
-                metadata={
-                    "location": data.location,
-                    "url": data.url,
-                    "public_metrics": data.public_metrics,
-                },
-            )
-
-            if data.public_metrics:
-                profile.follower_count = data.public_metrics.get("followers_count", 0)
-                profile.following_count = data.public_metrics.get("following_count", 0)
-                profile.post_count = data.public_metrics.get("tweet_count", 0)
-
+            profile = self._build_profile(user.data)
             self.cache_response(cache_key, profile.to_dict(), ttl_seconds=86400)
             return profile
 
@@ -113,6 +93,101 @@ class TwitterSource(APIClient):
             logger.error(f"Error fetching Twitter profile: {e}")
             raise
 
+    def get_profiles(self, identifiers: list[str]) -> list[SocialProfile | None]:
+        """Get several Twitter profiles using the batch users lookup endpoint."""
+        profiles: dict[str, SocialProfile] = {}
+        missing: list[str] = []
+
+        # Usernames are case-insensitive; look each one up once.
+        unique: dict[str, str] = {}
+        for identifier in identifiers:
+            unique.setdefault(identifier.lower(), identifier)
+
+        for key, identifier in unique.items():
+            cached = self.get_cached_response(self._get_cache_key("profile", key))
+            if cached:
+                profiles[key] = SocialProfile(**cached)
+            else:
+                missing.append(identifier)
+
+        if missing and not self._client:
+            raise RuntimeError("Twitter client not initialized. Check bearer_token in config.")
+
+        try:
+            for start in range(0, len(missing), _USERS_LOOKUP_BATCH):
+                batch = missing[start : start + _USERS_LOOKUP_BATCH]
+                response = self._retry_with_backoff(
+                    lambda: self._client.get_users(usernames=batch, user_fields=_USER_FIELDS)
+                )
+
+                for data in response.data or []:
+                    profile = self._build_profile(data)
+                    key = profile.username.lower()
+                    profiles[key] = profile
+                    self.cache_response(
+                        self._get_cache_key("profile", key),
+                        profile.to_dict(),
+                        ttl_seconds=86400,
+                    )
+        except tweepy.Unauthorized:
+            raise RuntimeError("Unauthorized: Check your Twitter API bearer token")
+        except Exception as e:
+            logger.error(f"Error fetching Twitter profiles: {e}")
+            raise
+
+        return [profiles.get(identifier.lower()) for identifier in identifiers]
+
+    def _build_profile(self, data: Any) -> SocialProfile:
+        """Build a SocialProfile from a tweepy user object."""
+        profile = SocialProfile(
+            platform=SocialPlatform.TWITTER,
+            user_id=str(data.id),
+            username=data.username,
+            display_name=data.name,
+            bio=data.description or "",
+            profile_url=f"https://twitter.com/{data.username}",
+            profile_picture_url=data.profile_image_url,
+            verified=data.verified or False,
+            created_date=data.created_at,
+            metadata={
+                "location": data.location,
+                "url": data.url,
+                "public_metrics": data.public_metrics,
+            },
+        )
+
+        if data.public_metrics:
+            profile.follower_count = data.public_metrics.get("followers_count", 0)
+            profile.following_count = data.public_metrics.get("following_count", 0)
+            profile.post_count = data.public_metrics.get("tweet_count", 0)
+
+        return profile
+
+    def _build_post(self, tweet: Any, metadata: dict[str, Any]) -> Post:
+        """Build a Post from a tweepy tweet object."""
+        hashtags = []
+        mentions = []
+
+        if tweet.entities:
+            hashtags = [h["tag"] for h in tweet.entities.get("hashtags", [])]
+            mentions = [m["username"] for m in tweet.entities.get("mentions", [])]
+
+        metrics = tweet.public_metrics or {}
+
+        return Post(
+            id=str(tweet.id),
+            platform=SocialPlatform.TWITTER,
+            text=tweet.text,
+            timestamp=tweet.created_at,
+            likes=metrics.get("like_count", 0),
+            shares=metrics.get("retweet_count", 0),
+            comments=metrics.get("reply_count", 0),
+            hashtags=hashtags,
+            mentions=mentions,
+            sentiment=self._analyze_sentiment(tweet.text),
+            metadata=metadata,
+        )
+
     def get_posts(self, user_id: str, limit: int = 100) -> list[Post]:
         """Get tweets for a user."""
         cache_key = self._get_cache_key("posts", user_id)
@@ -143,32 +218,10 @@ class TwitterSource(APIClient):
             if not tweets.data:
                 return []
 
-            posts = []
-            for tweet in tweets.data:
-                hashtags = []
-                mentions = []
-
-                if tweet.entities:
-                    hashtags = [h["tag"] for h in tweet.entities.get("hashtags", [])]
-                    mentions = [m["username"] for m in tweet.entities.get("mentions", [])]
-
-                metrics = tweet.public_metrics or {}
-
-                post = Post(
-                    id=str(tweet.id),
-                    platform=SocialPlatform.TWITTER,
-                    text=tweet.text,
-                    timestamp=tweet.created_at,
-                    likes=metrics.get("like_count", 0),
-                    shares=metrics.get("retweet_count", 0),
-                    comments=metrics.get("reply_count", 0),
-                    hashtags=hashtags,
-                    mentions=mentions,
-                    sentiment=self._analyze_sentiment(tweet.text),
-                    metadata={"context_annotations": tweet.context_annotations},
-                )
-
-                posts.append(post)
+            posts = [
+                self._build_post(tweet, {"context_annotations": tweet.context_annotations})
+                for tweet in tweets.data
+            ]
 
             self.cache_response(cache_key, [p.to_dict() for p in posts], ttl_seconds=604800)
             return posts
@@ -255,35 +308,6 @@ class TwitterSource(APIClient):
             logger.error(f"Error searching Twitter users: {e}")
             raise
 
-    def _analyze_sentiment(self, text: str) -> float:
-        """Analyze sentiment of tweet text."""
-        try:
-            from textblob import TextBlob
-
-            blob = TextBlob(text)
-            return blob.sentiment.polarity
-        except Exception:
-            return 0.0
-
-    def get_engagement_metrics(self, profile: SocialProfile, posts: list[Post]) -> EngagementMetrics:
-        """Calculate engagement metrics for a profile."""
-        if not posts:
-            return EngagementMetrics(avg_engagement_rate=0.0, total_engagement=0, post_frequency=0.0)
-
-        total_engagement = sum(p.likes + p.shares + p.comments for p in posts)
-        avg_engagement_rate = total_engagement / len(posts) if posts else 0.0
-
-        follower_count = profile.follower_count or 1
-        engagement_rate = (total_engagement / follower_count) * 100
-
-        post_frequency = len(posts) / 30.0 if posts else 0.0
-
-        return EngagementMetrics(
-            avg_engagement_rate=engagement_rate,
-            total_engagement=total_engagement,
-            post_frequency=post_frequency,
-        )
-
     def search_hashtags(self, hashtag: str, limit: int = 100) -> list[Post]:
         """Search for tweets by hashtag."""
         if not self._client:
@@ -309,34 +333,7 @@ class TwitterSource(APIClient):
             if not tweets.data:
                 return []
 
-            posts = []
-            for tweet in tweets.data:
-                hashtags = []
-                mentions = []
-
-                if tweet.entities:
-                    hashtags = [h["tag"] for h in tweet.entities.get("hashtags", [])]
-                    mentions = [m["username"] for m in tweet.entities.get("mentions", [])]
-
-                metrics = tweet.public_metrics or {}
-
-                post = Post(
-                    id=str(tweet.id),
-                    platform=SocialPlatform.TWITTER,
-                    text=tweet.text,
-                    timestamp=tweet.created_at,
-                    likes=metrics.get("like_count", 0),
-                    shares=metrics.get("retweet_count", 0),
-                    comments=metrics.get("reply_count", 0),
-                    hashtags=hashtags,
-                    mentions=mentions,
-                    sentiment=self._analyze_sentiment(tweet.text),
-                    metadata={"author_id": tweet.author_id},
-                )
-
-                posts.append(post)
-
-            return posts
+            return [self._build_post(tweet, {"author_id": tweet.author_id}) for tweet in tweets.data]
 
         except Exception as e:
             logger.error(f"Error searching Twitter hashtags: {e}")
@@ -5,6 +5,11 @@ import json
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 class FileHandler:
     """Centralized file I/O operations for CSV and JSON formats.
@@ -94,6 +99,9 @@ class FileHandler:
             json.JSONDecodeError: If the file contains invalid JSON.
             IOError: If the file cannot be read.
         """
+        if orjson:
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError.
+            return orjson.loads(filepath.read_bytes())
         return json.loads(filepath.read_text(encoding="utf-8"))
 
     @staticmethod
@@ -333,6 +333,33 @@ class TestNetworkCorrelationAlgorithm:
 
         assert len(relationships) >= 1
 
+    def test_extract_domain_from_url(self, network_algorithm):
+        """Test host extraction from website URLs with and without a scheme."""
+        extract = network_algorithm._extract_domain_from_url
+
+        assert extract("https://www.Example.com:8080/a?b") == "example.com"
+        assert extract("ftp://files.example.com/x") == "files.example.com"
+        assert extract("www.example.com/path") == "example.com"
+        assert extract("example.com/?next=https://x.com") == "example.com"
+        assert extract("example.com/a//b") == "example.com"
+        assert extract("") is None
+        assert extract("http://") is None
+
+    def test_ip_subnet_boundaries(self, network_algorithm):
+        """Test that subnet correlation respects /24 and /64 prefixes."""
+        entities = [
+            Entity(id="v4_a", type=EntityType.IP, name="10.0.1.10", attributes={}, sources=["twitter"]),
+            Entity(id="v4_b", type=EntityType.IP, name="10.0.2.10", attributes={}, sources=["github"]),
+            Entity(id="v6_a", type=EntityType.IP, name="2001:db8::1", attributes={}, sources=["twitter"]),
+            Entity(id="v6_b", type=EntityType.IP, name="2001:db8::ff", attributes={}, sources=["github"]),
+        ]
+
+        relationships = network_algorithm.correlate(entities)
+
+        assert len(relationships) == 1
+        assert relationships[0].metadata["subnet"] == "2001:db8::/64"
+        assert relationships[0].confidence == 35.0
+
     def test_exact_domain_match(self, network_algorithm):
         """Test exact domain matching."""
         entities = [
@@ -438,3 +465,62 @@ class TestTemporalCorrelationAlgorithm:
 
         # Should not correlate accounts created a year apart
         assert len(relationships) == 0
+
+    def test_activity_overlap_window(self, temporal_algorithm):
+        """Test that activity within the window counts and activity outside does not."""
+        from datetime import datetime, timedelta
+
+        base = datetime(2024, 1, 1, 12, 0)
+        entity_a = Entity(
+            id="entity_1",
+            type=EntityType.ACCOUNT,
+            name="user1",
+            attributes={"activity_times": [base, base + timedelta(days=10), "2024-02-01T00:00:00Z"]},
+            sources=["twitter"],
+        )
+        entity_b = Entity(
+            id="entity_2",
+            type=EntityType.ACCOUNT,
+            name="user2",
+            attributes={
+                "activity_times": [
+                    base + timedelta(days=10, hours=24),
+                    base - timedelta(hours=3),
+                    base + timedelta(days=40),
+                ]
+            },
+            sources=["github"],
+        )
+
+        rel = temporal_algorithm._correlate_by_activity_time(entity_a, entity_b)
+
+        assert rel is not None
+        assert rel.metadata["overlap_count"] == 2
+        assert rel.metadata["total_checked"] == 3
+
+    def test_parse_datetime_formats(self, temporal_algorithm):
+        """Test that supported date formats parse to naive datetimes."""
+        from datetime import datetime
+
+        expected = datetime(2020, 1, 15, 10, 30)
+
+        assert temporal_algorithm._parse_datetime("2020-01-15T10:30:00Z") == expected
+        assert temporal_algorithm._parse_datetime("2020-01-15T10:30:00.000Z") == expected
+        assert temporal_algorithm._parse_datetime("2020-01-15T10:30:00.12Z") == expected.replace(
+            microsecond=120000
+        )
+        assert temporal_algorithm._parse_datetime("2020-01-15 10:30:00") == expected
+        assert temporal_algorithm._parse_datetime("2020-1-15 10:30:00") == expected
+        assert temporal_algorithm._parse_datetime("2020-01-15T10:30:00") == expected
+        assert temporal_algorithm._parse_datetime("2020-01-15") == datetime(2020, 1, 15)
+        assert temporal_algorithm._parse_datetime("15/01/2020 10:30:00") == expected
+        assert temporal_algorithm._parse_datetime("01/15/2020 10:30:00") == expected
+        assert temporal_algorithm._parse_datetime("not a date") is None
+
+    def test_parse_datetime_rejects_formats_outside_the_list(self, temporal_algorithm):
+        """Test that extended ISO forms are rejected on every Python version."""
+        assert temporal_algorithm._parse_datetime("2020-01-15T10:30:00+01:00") is None
+        assert temporal_algorithm._parse_datetime("2020-01-15T10:30") is None
+        assert temporal_algorithm._parse_datetime("2020-W03-3") is None
+        assert temporal_algorithm._parse_datetime("20200115") is None
+        assert temporal_algorithm._parse_datetime("2020-13-15") is None
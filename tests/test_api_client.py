@@ -0,0 +1,124 @@
+"""Tests for the APIClient response cache."""
+
+from __future__ import annotations
+
+import json
+
+from osint.core.models import Post, SocialProfile
+from osint.sources import api_client
+from osint.sources.api_client import APIClient, User
+
+
+class _StubClient(APIClient):
+    def get_profile(self, identifier: str) -> SocialProfile:
+        raise ValueError(identifier)
+
+    def get_posts(self, user_id: str, limit: int = 100) -> list[Post]:
+        return []
+
+    def get_followers(self, user_id: str, limit: int = 100) -> list[User]:
+        return []
+
+    def search_user(self, query: str) -> list[User]:
+        return []
+
+    def validate_credentials(self) -> bool:
+        return True
+
+    def handle_rate_limiting(self) -> None:
+        return
+
+
+def test_response_cache_serves_repeat_reads_from_memory(tmp_path):
+    """Test that a cached response is read back without touching the disk again."""
+    source = _StubClient({"cache_dir": str(tmp_path)})
+
+    source.cache_response("profile_testuser", {"username": "testuser"})
+    cache_file = tmp_path / "profile_testuser.json"
+    assert cache_file.exists()
+    cache_file.unlink()
+
+    assert source.get_cached_response("profile_testuser") == {"username": "testuser"}
+
+
+def test_response_cache_expires_memory_entries(tmp_path):
+    """Test that expired in-memory entries are not returned."""
+    source = _StubClient({"cache_dir": str(tmp_path)})
+
+    source.cache_response("profile_testuser", {"username": "testuser"}, ttl_seconds=-1)
+
+    assert source.get_cached_response("profile_testuser") is None
+
+
+def test_response_cache_purges_expired_entries_on_write(tmp_path):
+    """Test that writing a new entry evicts expired ones from memory."""
+    source = _StubClient({"cache_dir": str(tmp_path)})
+
+    source.cache_response("profile_old", {"username": "old"}, ttl_seconds=-1)
+    source.cache_response("profile_new", {"username": "new"})
+
+    assert "profile_old" not in source._memory_cache
+    assert "profile_new" in source._memory_cache
+
+
+def test_response_cache_expiry_heap_stays_bounded(tmp_path):
+    """Test that rewriting the same keys does not grow the expiry heap."""
+    source = _StubClient({"cache_dir": str(tmp_path)})
+
+    for i in range(50):
+        source.cache_response(f"profile_{i % 5}", {"n": i}, ttl_seconds=604800)
+
+    assert len(source._memory_cache) == 5
+    assert len(source._memory_expiry) <= 2 * len(source._memory_cache)
+
+
+def test_response_cache_hits_do_not_share_objects(tmp_path):
+    """Test that mutating a cached response does not change later reads."""
+    source = _StubClient({"cache_dir": str(tmp_path)})
+
+    original = {"username": "testuser", "metadata": {"location": "Earth"}}
+    source.cache_response("profile_testuser", original)
+    original["metadata"]["location"] = "Mars"
+
+    first = source.get_cached_response("profile_testuser")
+    first["metadata"]["location"] = "Moon"
+
+    assert source.get_cached_response("profile_testuser") == {
+        "username": "testuser",
+        "metadata": {"location": "Earth"},
+    }
+
+
+def test_response_cache_writes_the_same_payload_to_disk(tmp_path):
+    """Test that the on-disk entry holds the payload served from memory."""
+    source = _StubClient({"cache_dir": str(tmp_path)})
+
+    source.cache_response("profile_testuser", {"username": "testuser", "ids": [1, 2]})
+    on_disk = json.loads((tmp_path / "profile_testuser.json").read_text(encoding="utf-8"))
+
+    assert on_disk["data"] == source.get_cached_response("profile_testuser")
+    assert _StubClient({"cache_dir": str(tmp_path)}).get_cached_response("profile_testuser") == on_disk["data"]
+
+
+def test_response_cache_skips_unserialisable_data_in_both_layers(tmp_path):
+    """Test that data the serialiser rejects is cached nowhere."""
+    source = _StubClient({"cache_dir": str(tmp_path)})
+
+    source.cache_response("profile_bad", {"obj": object()})
+
+    assert "profile_bad" not in source._memory_cache
+    assert not (tmp_path / "profile_bad.json").exists()
+
+
+def test_response_cache_round_trips_with_json_fallback(tmp_path, monkeypatch):
+    """Test the stdlib json path used when orjson is not installed."""
+    monkeypatch.setattr(api_client, "orjson", None)
+    source = _StubClient({"cache_dir": str(tmp_path)})
+
+    source.cache_response("profile_testuser", {"username": "testuser", "ids": [1, 2]})
+
+    assert source.get_cached_response("profile_testuser") == {"username": "testuser", "ids": [1, 2]}
+    assert _StubClient({"cache_dir": str(tmp_path)}).get_cached_response("profile_testuser") == {
+        "username": "testuser",
+        "ids": [1, 2],
+    }
@@ -0,0 +1,39 @@
+"""Tests for FileHandler JSON reading."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from osint.utils import file_handler
+from osint.utils.file_handler import FileHandler
+
+
+@pytest.fixture(params=["orjson", "json"])
+def json_backend(request, monkeypatch):
+    """Run a test with orjson (when installed) and with the stdlib fallback."""
+    if request.param == "json":
+        monkeypatch.setattr(file_handler, "orjson", None)
+    elif file_handler.orjson is None:
+        pytest.skip("orjson is not installed")
+    return request.param
+
+
+def test_read_json_round_trips_write_json(tmp_path, json_backend):
+    """Test that read_json returns what write_json stored."""
+    path = tmp_path / "data.json"
+    data = {"name": "Ünïcode", "items": [1, 2.5, None, True]}
+
+    FileHandler.write_json(data, path)
+
+    assert FileHandler.read_json(path) == data
+
+
+def test_read_json_invalid_raises_json_decode_error(tmp_path, json_backend):
+    """Test that invalid JSON raises json.JSONDecodeError on either backend."""
+    path = tmp_path / "broken.json"
+    path.write_text("{not json", encoding="utf-8")
+
+    with pytest.raises(json.JSONDecodeError):
+        FileHandler.read_json(path)
@@ -231,3 +231,27 @@ def test_rate_limit_status_to_dict():
     assert status_dict["requests_remaining"] == 440
     assert "window_start" in status_dict
     assert "reset_at" in status_dict
+
+
+def test_throttled_platform_does_not_block_others():
+    """Test that waiting on one platform leaves other platforms usable."""
+    import threading
+    import time
+
+    limiter = RateLimiter()
+    limiter.configure_platform("slow", RateLimitConfig(requests_per_window=1, window_seconds=1))
+    limiter.acquire("slow")
+    limiter.record_request("slow", "default", True, 0.1)
+
+    waiter = threading.Thread(target=limiter.acquire, args=("slow",))
+    waiter.start()
+    time.sleep(0.1)
+
+    start = time.monotonic()
+    limiter.acquire("twitter")
+    limiter.record_request("twitter", "default", True, 0.1)
+    elapsed = time.monotonic() - start
+    waiter.join()
+
+    assert elapsed < 0.5
+    assert limiter.get_status("twitter").requests_made == 1
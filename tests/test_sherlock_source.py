@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import threading
+import time
 from concurrent.futures import Future
 from dataclasses import dataclass
 from typing import Any
@@ -7,7 +9,7 @@ from typing import Any
 import pytest
 
 from osint.core.models import QueryStatus
-from osint.sources.sherlock_source import SherlockSource
+from osint.sources.sherlock_source import SherlockSource, SherlockUnavailableError
 
 
 @dataclass
@@ -27,6 +29,12 @@ class _Response:
     headers: dict[str, str] | None = None
 
 
+@dataclass
+class _Delayed:
+    seconds: float
+    response: _Response
+
+
 class _FakeSession:
     def __init__(self, responses_by_url: dict[str, list[Any]]) -> None:
         self.responses_by_url = {k: list(v) for k, v in responses_by_url.items()}
@@ -42,7 +50,9 @@ class _FakeSession:
             return fut
 
         item = queue.pop(0)
-        if isinstance(item, Exception):
+        if isinstance(item, _Delayed):
+            threading.Timer(item.seconds, fut.set_result, args=(item.response,)).start()
+        elif isinstance(item, Exception):
             fut.set_exception(item)
         else:
             fut.set_result(item)
@@ -114,6 +124,19 @@ def test_multiple_username_search(site_data: dict[str, Any]) -> None:
     assert len(results) == 4
 
 
+def test_duplicate_usernames_are_checked_once(site_data: dict[str, Any]) -> None:
+    responses = {
+        "https://github.com/john": [_Response(200, "", "https://github.com/john", _Elapsed(0.1))],
+    }
+
+    fake_session = _FakeSession(responses)
+
+    src = SherlockSource(site_data=site_data, session_factory=lambda _: fake_session)
+    results = src.search(["john", " john ", "john"], sites=["GitHub"], no_nsfw=False)
+    assert len(results) == 1
+    assert len(fake_session.calls) == 1
+
+
 def test_site_filtering(site_data: dict[str, Any]) -> None:
     responses = {
         "https://github.com/john": [_Response(200, "", "https://github.com/john", _Elapsed(0.1))],
@@ -160,3 +183,135 @@ def test_retry_on_exception(site_data: dict[str, Any]) -> None:
     assert len(results) == 1
     assert results[0].status == QueryStatus.FOUND
     assert len(fake_session.calls) == 2
+
+
+def test_site_data_is_read_only(site_data: dict[str, Any]) -> None:
+    src = SherlockSource(site_data=site_data)
+    with pytest.raises(TypeError):
+        src._ensure_site_data()["Injected"] = {}
+    assert "Injected" not in src.available_sites()
+
+
+def test_retry_after_does_not_delay_other_sites(site_data: dict[str, Any]) -> None:
+    responses = {
+        "https://github.com/john": [
+            _Response(429, "", "https://github.com/john", _Elapsed(0.1), {"Retry-After": "1"}),
+            _Response(200, "", "https://github.com/john", _Elapsed(0.1)),
+        ],
+        "https://forum.example/u/john": [
+            _Delayed(0.05, _Response(200, "", "https://forum.example/u/john", _Elapsed(0.05))),
+        ],
+    }
+
+    fake_session = _FakeSession(responses)
+    reported_at: list[float] = []
+
+    src = SherlockSource(
+        {"sherlock": {"retries": 1}},
+        site_data=site_data,
+        session_factory=lambda _: fake_session,
+    )
+    start = time.monotonic()
+    results = src.search(
+        ["john"],
+        no_nsfw=False,
+        progress_callback=lambda done, total: reported_at.append(time.monotonic() - start),
+    )
+
+    assert [r.platform_name for r in results] == ["ExampleForum", "GitHub"]
+    assert reported_at[0] < 0.5
+    assert reported_at[1] >= 0.9
+
+
+def test_retries_keep_configured_request_timeout(site_data: dict[str, Any]) -> None:
+    responses = {
+        "https://github.com/john": [
+            _Response(429, "", "https://github.com/john", _Elapsed(0.1), {"Retry-After": "1"}),
+            _Response(200, "", "https://github.com/john", _Elapsed(0.1)),
+        ],
+        "https://forum.example/u/john": [
+            TimeoutError("timed out"),
+            _Delayed(0.05, _Response(200, "", "https://forum.example/u/john", _Elapsed(0.05))),
+        ],
+    }
+
+    fake_session = _FakeSession(responses)
+
+    src = SherlockSource(
+        {"sherlock": {"retries": 1, "timeout": 15}},
+        site_data=site_data,
+        session_factory=lambda _: fake_session,
+        sleeper=lambda _: None,
+    )
+    results = src.search(["john"], no_nsfw=False)
+
+    assert all(r.status == QueryStatus.FOUND for r in results)
+    assert len(fake_session.calls) == 4
+    assert [kwargs["timeout"] for _, _, kwargs in fake_session.calls] == [15.0] * 4
+
+
+def test_site_data_loaded_once_per_process(monkeypatch: pytest.MonkeyPatch) -> None:
+    import osint.sources.sherlock_source as sherlock_source
+
+    calls: list[int] = []
+
+    def fake_load() -> dict[str, Any]:
+        calls.append(1)
+        return {"GitHub": {"url": "https://github.com/{}", "errorType": "status_code"}}
+
+    monkeypatch.setattr(sherlock_source, "_SITE_DATA_CACHE", None)
+    monkeypatch.setattr(sherlock_source, "_load_sherlock_site_data", fake_load)
+
+    assert SherlockSource().available_sites() == ["GitHub"]
+    assert SherlockSource().available_sites() == ["GitHub"]
+    assert len(calls) == 1
+
+
+def test_site_data_loads_with_json_fallback(monkeypatch: pytest.MonkeyPatch) -> None:
+    import osint.sources.sherlock_source as sherlock_source
+
+    try:
+        expected = sherlock_source._load_sherlock_site_data()
+    except SherlockUnavailableError:
+        pytest.skip("Sherlock is not installed")
+
+    monkeypatch.setattr(sherlock_source, "orjson", None)
+    assert sherlock_source._load_sherlock_site_data() == expected
+
+
+def test_rate_limited_retry_honours_retry_after(site_data: dict[str, Any]) -> None:
+    responses = {
+        "https://github.com/john": [
+            _Response(429, "", "https://github.com/john", _Elapsed(0.1), {"Retry-After": "5"}),
+            _Response(200, "", "https://github.com/john", _Elapsed(0.1)),
+        ]
+    }
+
+    fake_session = _FakeSession(responses)
+    sleeps: list[float] = []
+
+    src = SherlockSource(
+        {"sherlock": {"retries": 1}},
+        site_data=site_data,
+        session_factory=lambda _: fake_session,
+        sleeper=sleeps.append,
+    )
+    results = src.search(["john"], sites=["GitHub"], no_nsfw=False)
+    assert results[0].status == QueryStatus.FOUND
+    assert len(sleeps) == 1
+    assert 4.9 <= sleeps[0] < 5.5
+
+
+def test_cloudflare_403_reported_as_waf(site_data: dict[str, Any]) -> None:
+    responses = {
+        "https://github.com/john": [
+            _Response(403, "", "https://github.com/john", _Elapsed(0.1), {"Server": "cloudflare"}),
+        ]
+    }
+
+    fake_session = _FakeSession(responses)
+
+    src = SherlockSource(site_data=site_data, session_factory=lambda _: fake_session)
+    results = src.search(["john"], sites=["GitHub"], no_nsfw=False)
+    assert results[0].status == QueryStatus.ERROR
+    assert results[0].metadata["error"] == "waf_detected"
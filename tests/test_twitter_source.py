@@ -185,6 +185,52 @@ def test_user_not_found(mock_tweepy, mock_twitter_config):
         source.get_profile("nonexistentuser")
 
 
+@patch("osint.sources.twitter_source.tweepy")
+def test_get_profiles_uses_batch_lookup(mock_tweepy, mock_twitter_config, mock_twitter_response):
+    """Test that several profiles are fetched with one users lookup."""
+    import tweepy
+
+    user_data = {**mock_twitter_response['data'], 'created_at': None}
+    mock_client = MagicMock()
+    mock_response = MagicMock()
+    mock_response.data = [type('User', (), user_data)]
+    mock_client.get_users.return_value = mock_response
+    mock_tweepy.Client.return_value = mock_client
+    mock_tweepy.Unauthorized = tweepy.Unauthorized
+
+    source = TwitterSource(mock_twitter_config)
+    profiles = source.get_profiles(["TestUser", "missinguser", "testuser"])
+
+    mock_client.get_users.assert_called_once()
+    assert mock_client.get_users.call_args.kwargs["usernames"] == ["TestUser", "missinguser"]
+    assert profiles[0] is not None
+    assert profiles[0].username == "testuser"
+    assert profiles[1] is None
+    assert profiles[2] is profiles[0]
+
+
+@patch("osint.sources.twitter_source.tweepy")
+def test_get_profiles_cache_is_case_insensitive(mock_tweepy, mock_twitter_config, mock_twitter_response, tmp_path):
+    """Test that a mixed-case batch lookup is served from the cache the second time."""
+    import tweepy
+
+    user_data = {**mock_twitter_response['data'], 'created_at': None}
+    mock_client = MagicMock()
+    mock_response = MagicMock()
+    mock_response.data = [type('User', (), user_data)]
+    mock_client.get_users.return_value = mock_response
+    mock_tweepy.Client.return_value = mock_client
+    mock_tweepy.Unauthorized = tweepy.Unauthorized
+
+    config = {**mock_twitter_config, "cache_enabled": True, "cache_dir": str(tmp_path)}
+    source = TwitterSource(config)
+    source.get_profiles(["TestUser"])
+    profiles = source.get_profiles(["TestUser"])
+
+    mock_client.get_users.assert_called_once()
+    assert profiles[0].username == "testuser"
+
+
 def test_engagement_metrics_calculation():
     """Test engagement metrics calculation."""
     config = {"bearer_token": "test", "cache_enabled": False}